@@ -5,11 +5,12 @@ from pathlib import Path
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from ..models import Parameter
+from ..models import ALL_PARAMETERS, SITE_CODE_RE, Parameter
 from .constants import (
     DEFAULT_OUTPUT_FILENAME,
     DEFAULT_SITE_CODES,
     DEFAULT_SPARQL_ENDPOINT,
+    MAX_CONCURRENT_REQUESTS,
 )
 
 
@@ -28,11 +29,11 @@ class Settings(BaseSettings):
 
     # Data collection configuration
     site_codes: list[str] = Field(
-        default_factory=lambda: DEFAULT_SITE_CODES.copy(),
+        default_factory=lambda: list(DEFAULT_SITE_CODES),
         description="List of station codes to scrape",
     )
     parameters: list[Parameter] = Field(
-        default_factory=lambda: list(Parameter),
+        default_factory=lambda: list(ALL_PARAMETERS),
         description="Parameters to collect from LINDAS",
     )
 
@@ -59,6 +60,12 @@ class Settings(BaseSettings):
         le=60.0,
         description="Initial retry delay in seconds",
     )
+    max_concurrent_requests: int = Field(
+        default=MAX_CONCURRENT_REQUESTS,
+        ge=1,
+        le=32,
+        description="Maximum number of SPARQL queries in flight at once",
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="",
@@ -77,6 +84,15 @@ class Settings(BaseSettings):
             return [code.strip() for code in v.split(",") if code.strip()]
         return v
 
+    @field_validator("site_codes")
+    @classmethod
+    def validate_site_codes(cls, v: list[str]) -> list[str]:
+        """Check every site code is a 1-4 digit integer, once at load time."""
+        invalid = [code for code in v if not SITE_CODE_RE.fullmatch(code)]
+        if invalid:
+            raise ValueError(f"Site codes must be 1-4 digit integers: {invalid}")
+        return v
+
     @field_validator("parameters", mode="before")
     @classmethod
     def parse_parameters(cls, v: str | list[str | Parameter]) -> list[Parameter]:
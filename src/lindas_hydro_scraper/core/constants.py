@@ -5,9 +5,10 @@ DEFAULT_SPARQL_ENDPOINT = "https://ld.admin.ch/query"
 LINDAS_BASE_URL = "https://environment.ld.admin.ch/foen/hydro"
 DIMENSION_URL = f"{LINDAS_BASE_URL}/dimension"
 LINDAS_GRAPH = "https://lindas.admin.ch/foen/hydro"
+SPARQL_RESULTS_FORMAT = "application/sparql-results+json"
 
 # Default configuration
-DEFAULT_SITE_CODES = ["2044", "2112", "2491", "2355"]
+DEFAULT_SITE_CODES = ("2044", "2112", "2491", "2355")
 DEFAULT_OUTPUT_FILENAME = "lindas_hydro_data.csv"
 
 # CSV column names
@@ -21,9 +22,14 @@ CSV_COLUMNS = [
     "is_liter",
 ]
 
-# Retry configuration
+# Request configuration
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 2  # seconds
+MAX_RETRY_DELAY = 60  # seconds
+MAX_RETRY_DURATION = 120  # seconds, total time budget per query
+REQUEST_TIMEOUT = 30  # seconds
+MAX_CONCURRENT_REQUESTS = 4
+MAX_SITES_PER_QUERY = 100  # sites listed in one batch VALUES clause
 
 # Logging
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
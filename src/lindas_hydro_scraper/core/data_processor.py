@@ -3,14 +3,35 @@
 import logging
 from typing import Any
 
-from ..models import Measurement
+from ..models import Measurement, Parameter
 
 logger = logging.getLogger(__name__)
 
+# Map parameter names to measurement field names
+FIELD_MAPPING = {
+    "measurementTime": "timestamp",
+    "discharge": "discharge",
+    "waterLevel": "water_level",
+    "waterTemperature": "water_temperature",
+    "dangerLevel": "danger_level",
+    "isLiter": "is_liter",
+}
+
+# Map known predicate URIs straight to measurement field names
+_URI_TO_FIELD: dict[str, str] = {
+    param.uri: FIELD_MAPPING[param.value]
+    for param in Parameter
+    if param.value in FIELD_MAPPING
+}
+
 
 class DataProcessor:
     """Process raw SPARQL results into structured measurements."""
 
+    def __init__(self) -> None:
+        """Initialize data processor with the known predicate URIs."""
+        self._predicate_map: dict[str, str | None] = dict(_URI_TO_FIELD)
+
     def process_results(
         self, results: dict[str, Any], station_id: str
     ) -> Measurement | None:
@@ -24,7 +45,7 @@ class DataProcessor:
             Measurement object if valid data found, None otherwise.
         """
         if not self._validate_results(results):
-            logger.warning(f"Invalid results structure for station {station_id}")
+            logger.warning("Invalid results structure for station %s", station_id)
             return None
 
         # Extract data from results
@@ -32,23 +53,58 @@ class DataProcessor:
 
         # Check if we have a timestamp and at least one measurement
         if not data.get("timestamp"):
-            logger.warning(f"No timestamp found for station {station_id}")
+            logger.warning("No timestamp found for station %s", station_id)
             return None
 
         try:
-            measurement = Measurement(**data)
+            measurement = Measurement.from_raw(station_id, data)
 
             # Only return if we have actual measurements
             if measurement.has_measurements():
                 return measurement
             else:
-                logger.warning(f"No valid measurements found for station {station_id}")
+                logger.warning("No valid measurements found for station %s", station_id)
                 return None
 
         except Exception as e:
-            logger.error(f"Error creating measurement for station {station_id}: {e}")
+            logger.error("Error creating measurement for station %s: %s", station_id, e)
             return None
 
+    def process_batch_results(self, results: dict[str, Any]) -> dict[str, Measurement]:
+        """Process SPARQL results covering several stations.
+
+        Bindings are grouped by their ?subject observation URI and each group
+        is processed as a single station.
+
+        Args:
+            results: Raw SPARQL query results including a subject column.
+
+        Returns:
+            Measurements keyed by station code, for stations with valid data.
+        """
+        if not self._validate_results(results):
+            logger.warning("Invalid results structure for batch query")
+            return {}
+
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for binding in results["results"]["bindings"]:
+            try:
+                subject = binding["subject"]["value"]
+            except KeyError:
+                continue
+            station_id = subject.rpartition("/observation/")[2]
+            grouped.setdefault(station_id, []).append(binding)
+
+        measurements: dict[str, Measurement] = {}
+        for station_id, bindings in grouped.items():
+            measurement = self.process_results(
+                {"results": {"bindings": bindings}}, station_id
+            )
+            if measurement:
+                measurements[station_id] = measurement
+
+        return measurements
+
     def _validate_results(self, results: dict[str, Any]) -> bool:
         """Validate SPARQL results structure.
 
@@ -77,24 +133,53 @@ class DataProcessor:
             Dictionary of extracted data.
         """
         data = {"station_id": station_id}
+        remaining = len(FIELD_MAPPING)
 
         for binding in results["results"]["bindings"]:
-            predicate = binding.get("predicate", {}).get("value", "")
-            value = binding.get("object", {}).get("value")
+            try:
+                predicate = binding["predicate"]["value"]
+                value = binding["object"]["value"]
+            except KeyError:
+                continue
 
-            if not predicate or value is None:
+            if value is None:
                 continue
 
             # Map predicate to field name
             field_name = self._map_predicate_to_field(predicate)
             if field_name:
+                if field_name not in data:
+                    remaining -= 1
                 data[field_name] = value
 
+                # Every known field is set; skip any trailing bindings
+                if remaining == 0:
+                    break
+
         return data
 
     def _map_predicate_to_field(self, predicate_uri: str) -> str | None:
         """Map SPARQL predicate URI to measurement field name.
 
+        Known URIs resolve with a single lookup; other URIs are parsed once
+        and the result is remembered.
+
+        Args:
+            predicate_uri: Full predicate URI.
+
+        Returns:
+            Field name or None if not recognized.
+        """
+        try:
+            return self._predicate_map[predicate_uri]
+        except KeyError:
+            field_name = self._parse_predicate(predicate_uri)
+            self._predicate_map[predicate_uri] = field_name
+            return field_name
+
+    def _parse_predicate(self, predicate_uri: str) -> str | None:
+        """Parse a predicate URI into a measurement field name.
+
         Args:
             predicate_uri: Full predicate URI.
 
@@ -109,14 +194,4 @@ class DataProcessor:
         else:
             return None
 
-        # Map to field names
-        field_mapping = {
-            "measurementTime": "timestamp",
-            "discharge": "discharge",
-            "waterLevel": "water_level",
-            "waterTemperature": "water_temperature",
-            "dangerLevel": "danger_level",
-            "isLiter": "is_liter",
-        }
-
-        return field_mapping.get(param_name)
+        return FIELD_MAPPING.get(param_name)
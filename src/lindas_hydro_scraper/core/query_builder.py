@@ -1,19 +1,51 @@
 """SPARQL query builder for LINDAS hydro data."""
 
-from ..models import Parameter, QueryParameters
-from .constants import LINDAS_BASE_URL, LINDAS_GRAPH
+from functools import lru_cache
+
+from ..models import SITE_CODE_RE, Parameter, QueryParameters
+from .constants import LINDAS_BASE_URL, LINDAS_GRAPH, MAX_SITES_PER_QUERY
+
+# Placeholder substituted with the station code in cached query templates
+_SITE_CODE_PLACEHOLDER = "{site_code}"
+
+
+@lru_cache(maxsize=1024)
+def _render_query(template: str, site_code: str) -> str:
+    """Substitute a site code into a query template.
+
+    Templates and site codes are fixed for a run, so repeated scrapes reuse
+    the finished query strings.
+
+    Args:
+        template: Query template containing the site code placeholder.
+        site_code: Station code to substitute.
+
+    Returns:
+        Complete SPARQL query string.
+    """
+    return template.replace(_SITE_CODE_PLACEHOLDER, site_code)
 
 
 class SparqlQueryBuilder:
     """Builder for constructing SPARQL queries for hydrological data."""
 
-    def __init__(self, base_url: str = LINDAS_BASE_URL) -> None:
+    def __init__(
+        self,
+        base_url: str = LINDAS_BASE_URL,
+        parameters: list[Parameter] | None = None,
+    ) -> None:
         """Initialize query builder.
 
         Args:
             base_url: Base URL for LINDAS hydro data.
+            parameters: Parameters expected in subsequent queries. When given,
+                the query template for them is prepared up front.
         """
         self.base_url = base_url
+        self._templates: dict[tuple[str, ...], str] = {}
+
+        if parameters:
+            self._get_template(parameters)
 
     def build_query(self, params: QueryParameters) -> str:
         """Build SPARQL query for given parameters.
@@ -29,29 +61,61 @@ class SparqlQueryBuilder:
         """
         self._validate_parameters(params)
 
+        template = self._get_template(params.parameters)
+        return _render_query(template, params.site_code)
+
+    def _get_template(self, parameters: list[Parameter]) -> str:
+        """Get the query template for a parameter set, building it once.
+
+        Only the site code varies between queries in a run, so the PREFIX
+        block and parameter FILTER are formatted once per parameter set.
+
+        Args:
+            parameters: Parameters to retrieve.
+
+        Returns:
+            Query string containing the site code placeholder.
+        """
+        key = tuple(parameters)
+        template = self._templates.get(key)
+        if template is None:
+            template = self._build_template(parameters)
+            self._templates[key] = template
+        return template
+
+    def _build_template(self, parameters: list[Parameter]) -> str:
+        """Build a query template for the given parameters.
+
+        Args:
+            parameters: Parameters to retrieve.
+
+        Returns:
+            Query string containing the site code placeholder.
+        """
         # Build the FILTER clause for parameters
-        params_filter = self._build_parameters_filter(params.parameters)
+        params_filter = self._build_parameters_filter(parameters)
 
         # Construct the query
-        query = f"""PREFIX schema: <http://schema.org/>
+        return f"""PREFIX schema: <http://schema.org/>
 PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
 
 SELECT ?predicate ?object
 FROM <{LINDAS_GRAPH}>
 WHERE {{
-  BIND(<{self.base_url}/river/observation/{params.site_code}> AS ?subject)
+  BIND(<{self.base_url}/river/observation/{_SITE_CODE_PLACEHOLDER}> AS ?subject)
   ?subject ?predicate ?object .
   FILTER (?predicate IN (
     {params_filter}
   ))
 }}"""
 
-        return query
-
     def _validate_parameters(self, params: QueryParameters) -> None:
         """Validate query parameters.
 
+        Site code format is enforced by QueryParameters and Settings, so
+        only presence is checked here.
+
         Args:
             params: Parameters to validate.
 
@@ -61,16 +125,6 @@ WHERE {{
         if not params.site_code:
             raise ValueError("Site code is required")
 
-        # Validate site code format (1-4 digit integer)
-        try:
-            code_int = int(params.site_code)
-            if not 1 <= code_int <= 9999:
-                raise ValueError(f"Site code must be 1-4 digit integer: {params.site_code}")
-        except ValueError as e:
-            if "invalid literal" in str(e):
-                raise ValueError(f"Site code must be numeric: {params.site_code}") from e
-            raise
-
         if not params.parameters:
             raise ValueError("At least one parameter is required")
 
@@ -83,11 +137,15 @@ WHERE {{
         Returns:
             Formatted filter string for SPARQL query.
         """
-        param_uris = [f"<{param.uri}>" for param in parameters]
+        # QueryParameters stores enum values, so normalize back to Parameter
+        param_uris = [f"<{Parameter(param).uri}>" for param in parameters]
         return ",\n    ".join(param_uris)
 
     def build_batch_query(self, site_codes: list[str], parameters: list[Parameter]) -> str:
-        """Build query for multiple sites (for future optimization).
+        """Build a single query retrieving several sites at once.
+
+        The sites are listed in a VALUES clause, so results include the
+        ?subject column to tell stations apart.
 
         Args:
             site_codes: List of station codes.
@@ -95,7 +153,69 @@ WHERE {{
 
         Returns:
             SPARQL query for multiple sites.
+
+        Raises:
+            ValueError: If no site codes or parameters are given, or if a
+                site code is not a 1-4 digit integer.
+        """
+        if not site_codes:
+            raise ValueError("At least one site code is required")
+        if not parameters:
+            raise ValueError("At least one parameter is required")
+
+        # Codes are placed verbatim into IRIs, so check their format here
+        invalid = [code for code in site_codes if not SITE_CODE_RE.fullmatch(code)]
+        if invalid:
+            raise ValueError(f"Site codes must be 1-4 digit integers: {invalid}")
+
+        subjects = " ".join(
+            f"<{self.base_url}/river/observation/{site_code}>" for site_code in site_codes
+        )
+        params_filter = self._build_parameters_filter(parameters)
+
+        return f"""PREFIX schema: <http://schema.org/>
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+SELECT ?subject ?predicate ?object
+FROM <{LINDAS_GRAPH}>
+WHERE {{
+  VALUES ?subject {{ {subjects} }}
+  ?subject ?predicate ?object .
+  FILTER (?predicate IN (
+    {params_filter}
+  ))
+}}"""
+
+    def build_batch_queries(
+        self,
+        site_codes: list[str],
+        parameters: list[Parameter],
+        chunk_size: int = MAX_SITES_PER_QUERY,
+    ) -> list[tuple[list[str], str]]:
+        """Build batch queries covering sites in chunks.
+
+        Keeps each VALUES clause, and so each request and response, to a
+        bounded size when many sites are configured.
+
+        Args:
+            site_codes: List of station codes.
+            parameters: Parameters to retrieve.
+            chunk_size: Maximum number of sites per query.
+
+        Returns:
+            Pairs of the site codes in each chunk and the query covering them.
+
+        Raises:
+            ValueError: If no site codes or parameters are given, or if
+                chunk_size is not positive.
         """
-        # For now, we'll continue processing sites individually
-        # This method is a placeholder for future batch optimization
-        raise NotImplementedError("Batch queries not yet implemented")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        if not site_codes:
+            raise ValueError("At least one site code is required")
+
+        chunks = [
+            site_codes[i : i + chunk_size] for i in range(0, len(site_codes), chunk_size)
+        ]
+        return [(chunk, self.build_batch_query(chunk, parameters)) for chunk in chunks]
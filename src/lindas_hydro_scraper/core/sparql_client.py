@@ -1,25 +1,75 @@
 """SPARQL client for querying LINDAS endpoint."""
 
 import logging
-import time
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Final
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    RetryCallState,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    stop_before_delay,
+    wait_random_exponential,
+)
+
+from .constants import (
+    INITIAL_RETRY_DELAY,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_RETRIES,
+    MAX_RETRY_DELAY,
+    MAX_RETRY_DURATION,
+    REQUEST_TIMEOUT,
+    SPARQL_RESULTS_FORMAT,
+)
 
-from SPARQLWrapper import JSON, SPARQLWrapper
-from SPARQLWrapper.SPARQLExceptions import SPARQLWrapperException
+logger = logging.getLogger(__name__)
 
-from .constants import INITIAL_RETRY_DELAY, MAX_RETRIES
+# Failures worth retrying: network errors, HTTP error statuses, garbled bodies
+RETRYABLE_ERRORS = (requests.RequestException, orjson.JSONDecodeError)
 
-logger = logging.getLogger(__name__)
+# Cheapest query that proves the endpoint answers
+_CONNECTION_TEST_QUERY: Final = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 1"
+
+
+def _make_session(pool_size: int) -> requests.Session:
+    """Create a session configured for SPARQL JSON queries.
+
+    Args:
+        pool_size: Number of keep-alive connections to hold per host.
+
+    Returns:
+        Session requesting SPARQL JSON results over a sized connection pool.
+    """
+    session = requests.Session()
+    session.headers.update({"Accept": SPARQL_RESULTS_FORMAT})
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 class SparqlClient:
-    """Client for executing SPARQL queries with retry logic."""
+    """Client for executing SPARQL queries with retry logic.
+
+    Queries are sent as form-encoded POST requests over a single
+    ``requests.Session``, so the client is safe to share between worker
+    threads issuing queries concurrently. Connections are kept alive and
+    reused across queries, paying the TCP and TLS handshake only once per
+    pooled connection.
+    """
 
     def __init__(
         self,
         endpoint_url: str,
         max_retries: int = MAX_RETRIES,
         initial_delay: float = INITIAL_RETRY_DELAY,
+        timeout: float = REQUEST_TIMEOUT,
+        pool_size: int = MAX_CONCURRENT_REQUESTS,
+        retry_budget: float = MAX_RETRY_DURATION,
     ) -> None:
         """Initialize SPARQL client.
 
@@ -27,14 +77,30 @@ class SparqlClient:
             endpoint_url: SPARQL endpoint URL.
             max_retries: Maximum number of retry attempts.
             initial_delay: Initial retry delay in seconds.
+            timeout: Per-request timeout in seconds.
+            pool_size: Number of keep-alive connections to hold open, which
+                should match the number of threads sharing this client.
+            retry_budget: Total seconds a query may spend across attempts;
+                no retry is started that would end past this deadline.
         """
         self.endpoint_url = endpoint_url
         self.max_retries = max_retries
         self.initial_delay = initial_delay
-
-        self._client = SPARQLWrapper(endpoint_url)
-        self._client.setReturnFormat(JSON)
-        self._client.setMethod("POST")
+        self.timeout = timeout
+        self.pool_size = pool_size
+
+        self._session = _make_session(pool_size)
+
+        # Randomized exponential backoff keeps concurrent queries that fail
+        # together from retrying in lockstep, and the time budget bounds how
+        # long a slow endpoint can hold up a run
+        self._retrying = Retrying(
+            stop=stop_after_attempt(max_retries) | stop_before_delay(retry_budget),
+            wait=wait_random_exponential(multiplier=initial_delay, max=MAX_RETRY_DELAY),
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            before_sleep=self._log_retry,
+            reraise=True,
+        )
 
     def execute_query(self, query: str) -> dict[str, Any] | None:
         """Execute SPARQL query with retry logic.
@@ -45,42 +111,90 @@ class SparqlClient:
         Returns:
             Query results as dictionary or None if failed.
         """
-        self._client.setQuery(query)
-
-        retry_delay = self.initial_delay
-        last_error = None
-
-        for attempt in range(self.max_retries):
-            try:
-                logger.debug(f"Executing query (attempt {attempt + 1}/{self.max_retries})")
-                results = self._client.query().convert()
-
-                # Validate results
-                if self._validate_results(results):
-                    bindings_count = len(results.get("results", {}).get("bindings", []))
-                    logger.info(f"Query successful, retrieved {bindings_count} bindings")
-                    return results
-                else:
-                    logger.warning("Query returned empty or invalid results")
-                    return None
-
-            except SPARQLWrapperException as e:
-                last_error = e
-                logger.warning(
-                    f"SPARQL query failed (attempt {attempt + 1}/{self.max_retries}): {e}"
-                )
-
-                if attempt < self.max_retries - 1:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-
-            except Exception as e:
-                logger.error(f"Unexpected error executing query: {e}")
-                return None
-
-        logger.error(f"Query failed after {self.max_retries} attempts. Last error: {last_error}")
-        return None
+        # The time budget can stop retries before max_retries is reached
+        attempt_number = 0
+        try:
+            for attempt in self._retrying:
+                with attempt:
+                    attempt_number = attempt.retry_state.attempt_number
+                    results = self._post_query(query, attempt_number)
+        except RETRYABLE_ERRORS as e:
+            logger.error(
+                "Query failed after %d attempts. Last error: %s", attempt_number, e
+            )
+            return None
+        except Exception as e:
+            logger.error("Unexpected error executing query: %s", e)
+            return None
+
+        # Validate results
+        if self._validate_results(results):
+            bindings_count = len(results["results"]["bindings"])
+            logger.info("Query successful, retrieved %d bindings", bindings_count)
+            return results
+        else:
+            logger.warning("Query returned empty or invalid results")
+            return None
+
+    def execute_queries(self, queries: list[str]) -> list[dict[str, Any] | None]:
+        """Execute several SPARQL queries concurrently.
+
+        Queries run on up to ``pool_size`` threads sharing this client's
+        connection pool, each with its own retry logic.
+
+        Args:
+            queries: SPARQL query strings.
+
+        Returns:
+            Results for each query in input order, None where a query failed.
+        """
+        if len(queries) <= 1:
+            return [self.execute_query(query) for query in queries]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.pool_size, len(queries))
+        ) as executor:
+            return list(executor.map(self.execute_query, queries))
+
+    def _post_query(self, query: str, attempt_number: int) -> Any:
+        """Send a single query request and decode the JSON response.
+
+        Args:
+            query: SPARQL query string.
+            attempt_number: Current attempt, starting at 1, for logging.
+
+        Returns:
+            Decoded response body.
+
+        Raises:
+            requests.RequestException: If the request fails.
+            orjson.JSONDecodeError: If the response body is not valid JSON.
+        """
+        logger.debug(
+            "Executing query (attempt %d/%d)", attempt_number, self.max_retries
+        )
+
+        try:
+            response = self._session.post(
+                self.endpoint_url,
+                data={"query": query},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except RETRYABLE_ERRORS as e:
+            logger.warning(
+                "SPARQL query failed (attempt %d/%d): %s",
+                attempt_number,
+                self.max_retries,
+                e,
+            )
+            raise
+
+    def _log_retry(self, retry_state: RetryCallState) -> None:
+        """Log the delay before the next attempt."""
+        if retry_state.next_action is not None:
+            logger.info("Retrying in %.2f seconds...", retry_state.next_action.sleep)
 
     def _validate_results(self, results: Any) -> bool:
         """Validate query results structure.
@@ -91,12 +205,10 @@ class SparqlClient:
         Returns:
             True if valid, False otherwise.
         """
-        return (
-            isinstance(results, dict)
-            and "results" in results
-            and "bindings" in results["results"]
-            and isinstance(results["results"]["bindings"], list)
-        )
+        try:
+            return isinstance(results["results"]["bindings"], list)
+        except (TypeError, KeyError):
+            return False
 
     def test_connection(self) -> bool:
         """Test connection to SPARQL endpoint.
@@ -104,11 +216,13 @@ class SparqlClient:
         Returns:
             True if connection successful, False otherwise.
         """
-        test_query = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 1"
-
         try:
-            result = self.execute_query(test_query)
+            result = self.execute_query(_CONNECTION_TEST_QUERY)
             return result is not None
         except Exception as e:
-            logger.error(f"Connection test failed: {e}")
+            logger.error("Connection test failed: %s", e)
             return False
+
+    def close(self) -> None:
+        """Close pooled connections held by the client."""
+        self._session.close()
@@ -2,19 +2,20 @@
 
 import logging
 import sys
-import time
-
-from dotenv import load_dotenv
-
-from .core import Settings
-from .scrapers import LindasHydroScraper
-from .utils import setup_logging
 
 logger = logging.getLogger(__name__)
 
 
 def main() -> None:
     """Main entry point for the scraper."""
+    # Deferred so importing this module stays cheap; the scraper pulls in
+    # pydantic, pandas and requests
+    from dotenv import load_dotenv
+
+    from .core import Settings
+    from .scrapers import LindasHydroScraper
+    from .utils import setup_logging
+
     # Load environment variables
     load_dotenv()
 
@@ -26,18 +27,18 @@ def main() -> None:
     try:
         # Load configuration
         settings = Settings()
-        logger.info(f"Configuration loaded: {len(settings.site_codes)} sites to scrape")
-        logger.debug(f"Output directory: {settings.hydro_data_dir}")
+        logger.info("Configuration loaded: %d sites to scrape", len(settings.site_codes))
+        logger.debug("Output directory: %s", settings.hydro_data_dir)
 
         # Initialize and run scraper
         scraper = LindasHydroScraper(settings)
-        scraper.run()
-
-        # Small delay before cleaning duplicates
-        time.sleep(1)
+        try:
+            scraper.run()
 
-        # Clean duplicates
-        scraper.clean_duplicates()
+            # Clean duplicates
+            scraper.clean_duplicates()
+        finally:
+            scraper.close()
 
         logger.info("Scraping completed successfully")
 
@@ -45,7 +46,7 @@ def main() -> None:
         logger.info("Scraping interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -1,7 +1,21 @@
 """Data models for LINDAS hydro scraper."""
 
 from .measurement import Measurement
-from .query import Parameter, QueryParameters
+from .query import (
+    ALL_PARAMETERS,
+    SITE_CODE_PATTERN,
+    SITE_CODE_RE,
+    Parameter,
+    QueryParameters,
+)
 from .station import Station
 
-__all__ = ["Measurement", "Parameter", "QueryParameters", "Station"]
+__all__ = [
+    "Measurement",
+    "Parameter",
+    "QueryParameters",
+    "Station",
+    "ALL_PARAMETERS",
+    "SITE_CODE_PATTERN",
+    "SITE_CODE_RE",
+]
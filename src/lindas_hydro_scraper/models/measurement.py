@@ -1,63 +1,190 @@
 """Measurement data models."""
 
+import re
+import sys
+from collections.abc import Mapping
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
+from functools import cached_property
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+# Finite decimal number, optionally signed and with an exponent; ASCII only,
+# since the text is written to CSV unchanged
+_NUMERIC_PATTERN = re.compile(
+    r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?", re.ASCII
+)
+
+# Recognized boolean spellings
+_BOOL_VALUES = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "false": False,
+    "0": False,
+    "no": False,
+}
+
+# Values cached on an instance, derived from its fields
+_CACHED_ATTRS = ("unique_key", "_csv_row")
+
+# Pydantic's lax int validation, as applied to the danger_level field
+_INT_ADAPTER = TypeAdapter(int)
+
+# Valid danger levels by their raw int and string forms
+_DANGER_LEVELS: dict[int | str, int] = {
+    **{level: level for level in range(6)},
+    **{str(level): level for level in range(6)},
+}
+
+
+def _to_numeric_str(v: float | str | Decimal | None) -> str | None:
+    """Validate a numeric value, returning its string form.
+
+    Values are only written back out to CSV, so the source text is kept as
+    is rather than round-tripped through Decimal. Empty, non-numeric or
+    non-finite input returns None.
+    """
+    if v is None:
+        return None
+    text = str(v).strip()
+    if not _NUMERIC_PATTERN.fullmatch(text):
+        return None
+    return text
+
+
+def _to_station_id(v: str) -> str:
+    """Strip and intern a station identifier.
+
+    Only a few hundred stations exist, so every measurement for a station
+    shares one string object.
+    """
+    return sys.intern(v.strip())
+
+
+def _to_timestamp(v: str | datetime) -> datetime:
+    """Parse a timestamp from an ISO string or datetime."""
+    if isinstance(v, datetime):
+        return v
+    if isinstance(v, str):
+        # fromisoformat accepts any ISO 8601 form, including a Z suffix,
+        # on Python 3.11+
+        return datetime.fromisoformat(v)
+    raise ValueError(f"Invalid timestamp format: {v}")
+
+
+def _to_bool(v: bool | str | None) -> bool | None:
+    """Parse a boolean value, returning None for unrecognized input."""
+    if v is None or isinstance(v, bool):
+        return v
+    if isinstance(v, str):
+        return _BOOL_VALUES.get(v.lower().strip())
+    return None
+
+
+def _to_danger_level(v: int | str | None) -> int | None:
+    """Parse a danger level and check it lies within 0-5.
+
+    Follows the model's validation: integral floats and numeric strings such
+    as "2.0" are accepted, fractional values are rejected.
+    """
+    if v is None:
+        return None
+    try:
+        return _DANGER_LEVELS[v]
+    except (KeyError, TypeError):
+        pass
+    level = _INT_ADAPTER.validate_python(v)
+    if not 0 <= level <= 5:
+        raise ValueError(f"Danger level must be between 0 and 5: {v}")
+    return level
 
 
 class Measurement(BaseModel):
     """Represents a hydrological measurement at a specific time."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    # Frozen so cached derived values such as unique_key cannot go stale;
+    # model_copy drops them when fields are updated
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
 
     station_id: str = Field(..., description="Station identifier")
     timestamp: datetime = Field(..., description="Measurement timestamp")
-    discharge: Decimal | None = Field(None, description="Water discharge (m³/s)")
-    water_level: Decimal | None = Field(None, description="Water level (m)")
-    water_temperature: Decimal | None = Field(None, description="Water temperature (°C)")
+    discharge: str | None = Field(None, description="Water discharge (m³/s)")
+    water_level: str | None = Field(None, description="Water level (m)")
+    water_temperature: str | None = Field(None, description="Water temperature (°C)")
     danger_level: int | None = Field(None, ge=0, le=5, description="Danger level (0-5)")
     is_liter: bool | None = Field(None, description="Is measurement in liters")
 
     @field_validator("discharge", "water_level", "water_temperature", mode="before")
     @classmethod
-    def parse_decimal(cls, v: float | str | None) -> Decimal | None:
-        """Parse decimal values from various inputs."""
-        if v is None:
-            return None
-        if isinstance(v, str) and v.strip() == "":
-            return None
-        try:
-            return Decimal(str(v))
-        except (ValueError, TypeError, InvalidOperation):
-            return None
+    def parse_numeric(cls, v: float | str | Decimal | None) -> str | None:
+        """Validate numeric values from various inputs."""
+        return _to_numeric_str(v)
+
+    @field_validator("station_id")
+    @classmethod
+    def parse_station_id(cls, v: str) -> str:
+        """Intern the station identifier."""
+        return _to_station_id(v)
 
     @field_validator("timestamp", mode="before")
     @classmethod
     def parse_timestamp(cls, v: str | datetime) -> datetime:
         """Parse timestamp from string or datetime."""
-        if isinstance(v, datetime):
-            return v
-        if isinstance(v, str):
-            # Handle ISO format with timezone
-            return datetime.fromisoformat(v.replace("Z", "+00:00"))
-        raise ValueError(f"Invalid timestamp format: {v}")
+        return _to_timestamp(v)
 
     @field_validator("is_liter", mode="before")
     @classmethod
     def parse_bool(cls, v: bool | str | None) -> bool | None:
         """Parse boolean values from various inputs."""
-        if v is None:
-            return None
-        if isinstance(v, bool):
-            return v
-        if isinstance(v, str):
-            v_lower = v.lower().strip()
-            if v_lower in ("true", "1", "yes"):
-                return True
-            elif v_lower in ("false", "0", "no"):
-                return False
-        return None
+        return _to_bool(v)
+
+    @classmethod
+    def from_raw(cls, station_id: str, raw: dict[str, Any]) -> "Measurement":
+        """Create a measurement from raw SPARQL field values.
+
+        Each field is parsed once with the same helpers the validators use,
+        and the model is built without running Pydantic validation.
+
+        Args:
+            station_id: Station identifier.
+            raw: Raw field values keyed by field name. Must contain timestamp.
+
+        Returns:
+            Measurement built from the parsed values.
+
+        Raises:
+            KeyError: If no timestamp is present.
+            ValueError: If the timestamp or danger level is invalid.
+        """
+        return cls.model_construct(
+            station_id=_to_station_id(station_id),
+            timestamp=_to_timestamp(raw["timestamp"]),
+            discharge=_to_numeric_str(raw.get("discharge")),
+            water_level=_to_numeric_str(raw.get("water_level")),
+            water_temperature=_to_numeric_str(raw.get("water_temperature")),
+            danger_level=_to_danger_level(raw.get("danger_level")),
+            is_liter=_to_bool(raw.get("is_liter")),
+        )
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "Measurement":
+        """Copy the model, dropping cached values if fields are updated.
+
+        Args:
+            update: Field values to change in the copy.
+            deep: Whether to deep-copy field values.
+
+        Returns:
+            Copy of the measurement.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _CACHED_ATTRS:
+                copy.__dict__.pop(name, None)
+        return copy
 
     def has_measurements(self) -> bool:
         """Check if this record has any actual measurement values."""
@@ -67,18 +194,33 @@ class Measurement(BaseModel):
         )
 
     def to_csv_dict(self) -> dict[str, str | None]:
-        """Convert to dictionary for CSV export."""
-        return {
-            "timestamp": self.timestamp.isoformat(),
-            "station_id": self.station_id,
-            "discharge": str(self.discharge) if self.discharge is not None else None,
-            "water_level": str(self.water_level) if self.water_level is not None else None,
-            "danger_level": str(self.danger_level) if self.danger_level is not None else None,
-            "water_temperature": str(self.water_temperature) if self.water_temperature is not None else None,
-            "is_liter": str(self.is_liter).lower() if self.is_liter is not None else None,
-        }
-
-    @property
+        """Convert to dictionary for CSV export, keyed by CSV column."""
+        # Imported lazily: core imports models, so a module-level import is circular
+        from ..core.constants import CSV_COLUMNS
+
+        return dict(zip(CSV_COLUMNS, self._csv_row, strict=True))
+
+    def to_csv_row(self) -> tuple[str | None, ...]:
+        """Convert to a row tuple for CSV export, in CSV_COLUMNS order.
+
+        The row is formatted on first use and reused on later calls.
+        """
+        return self._csv_row
+
+    @cached_property
+    def _csv_row(self) -> tuple[str | None, ...]:
+        """Formatted CSV row, computed once per frozen instance."""
+        return (
+            self.timestamp.isoformat(),
+            self.station_id,
+            self.discharge,
+            self.water_level,
+            str(self.danger_level) if self.danger_level is not None else None,
+            self.water_temperature,
+            None if self.is_liter is None else ("true" if self.is_liter else "false"),
+        )
+
+    @cached_property
     def unique_key(self) -> str:
-        """Generate unique key for duplicate detection."""
+        """Generate unique key for duplicate detection, computed once."""
         return f"{self.timestamp.isoformat()}_{self.station_id}"
@@ -1,8 +1,18 @@
 """Query parameter models."""
 
+import re
 from enum import Enum
+from functools import cache
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, StringConstraints
+
+# Station codes are 1-4 digit integers without leading zeros
+SITE_CODE_PATTERN = r"^[1-9]\d{0,3}$"
+
+# Precompiled form for plain Python checks; use fullmatch, since re's $
+# also matches before a trailing newline
+SITE_CODE_RE = re.compile(r"[1-9]\d{0,3}")
 
 
 class Parameter(str, Enum):
@@ -19,19 +29,37 @@ class Parameter(str, Enum):
     @property
     def uri(self) -> str:
         """Get full URI for this parameter."""
-        from ..core.constants import DIMENSION_URL
+        return _parameter_uris()[self]
+
+
+@cache
+def _parameter_uris() -> dict[Parameter, str]:
+    """Build the URI of every parameter once, on first use."""
+    # Imported lazily: core imports models, so a module-level import is circular
+    from ..core.constants import DIMENSION_URL
 
-        if self == self.IS_LITER:
-            return "http://example.com/isLiter"
-        return f"{DIMENSION_URL}/{self.value}"
+    return {
+        param: (
+            "http://example.com/isLiter"
+            if param is Parameter.IS_LITER
+            else f"{DIMENSION_URL}/{param.value}"
+        )
+        for param in Parameter
+    }
+
+
+# Every parameter, in declaration order
+ALL_PARAMETERS = tuple(Parameter)
 
 
 class QueryParameters(BaseModel):
     """Parameters for SPARQL query construction."""
 
-    site_code: str = Field(..., description="Station code to query")
+    site_code: Annotated[str, StringConstraints(pattern=SITE_CODE_PATTERN)] = Field(
+        ..., description="Station code to query"
+    )
     parameters: list[Parameter] = Field(
-        default_factory=lambda: list(Parameter),
+        default_factory=lambda: list(ALL_PARAMETERS),
         description="Parameters to retrieve",
     )
 
@@ -1,6 +1,7 @@
 """Main LINDAS hydro data scraper implementation."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from ..core import DataProcessor, Settings, SparqlQueryBuilder
 from ..core.sparql_client import SparqlClient
@@ -27,48 +28,130 @@ class LindasHydroScraper:
             endpoint_url=self.settings.sparql_endpoint,
             max_retries=self.settings.retry_max_attempts,
             initial_delay=self.settings.retry_delay,
+            pool_size=self.settings.max_concurrent_requests,
+        )
+        self.query_builder = SparqlQueryBuilder(
+            base_url=self.settings.sparql_base_url,
+            parameters=self.settings.parameters,
         )
-        self.query_builder = SparqlQueryBuilder(base_url=self.settings.sparql_base_url)
         self.data_processor = DataProcessor()
         self.csv_handler = CsvHandler(self.settings.output_path)
 
     def run(self) -> None:
         """Run the scraper for all configured sites."""
-        logger.info(
-            f"Starting data collection for {len(self.settings.site_codes)} sites"
-        )
+        logger.info("Starting data collection for %d sites", len(self.settings.site_codes))
 
         # Test connection first
         if not self.sparql_client.test_connection():
             logger.error("Failed to connect to SPARQL endpoint")
             return
 
+        site_codes = self.settings.site_codes
+
+        # Chunked VALUES queries cover every site; sites in a chunk whose
+        # batch query fails are queried one by one
+        if len(site_codes) > 1:
+            measurements, errors = self._scrape_batch(site_codes)
+        else:
+            measurements, errors = self._scrape_sites(site_codes)
+
+        # Save results
+        if measurements:
+            new_count = self.csv_handler.save_measurements(measurements)
+            logger.info(
+                "Completed: %d sites processed, %d new records saved, %d errors",
+                len(measurements),
+                new_count,
+                errors,
+            )
+        else:
+            logger.warning("No measurements collected from any site")
+
+    def _scrape_batch(self, site_codes: list[str]) -> tuple[list[Measurement], int]:
+        """Scrape data for several sites with batch queries.
+
+        Sites are split into chunks of at most MAX_SITES_PER_QUERY, one
+        VALUES query each, and the queries are issued concurrently. Only the
+        sites of a chunk whose query fails fall back to per-site queries.
+
+        Args:
+            site_codes: Station codes to scrape.
+
+        Returns:
+            Measurements in site order and the number of sites that errored;
+            a failed batch query is not an error if its sites recover.
+        """
+        logger.debug("Processing batch of %d sites", len(site_codes))
+
+        try:
+            batches = self.query_builder.build_batch_queries(
+                site_codes, self.settings.parameters
+            )
+        except ValueError as e:
+            logger.error("Invalid parameters for batch query: %s", e)
+            return self._scrape_sites(site_codes)
+
+        results = self.sparql_client.execute_queries([query for _, query in batches])
+
+        measurements: list[Measurement] = []
+        errors = 0
+        for (chunk, _), chunk_results in zip(batches, results, strict=True):
+            if chunk_results is None:
+                logger.warning(
+                    "Batch query failed for %d sites, querying them individually",
+                    len(chunk),
+                )
+                chunk_measurements, chunk_errors = self._scrape_sites(chunk)
+                measurements.extend(chunk_measurements)
+                errors += chunk_errors
+                continue
+
+            by_site = self.data_processor.process_batch_results(chunk_results)
+            for site_code in chunk:
+                measurement = by_site.get(site_code)
+                if measurement:
+                    measurements.append(measurement)
+                else:
+                    logger.warning("No data retrieved for site %s", site_code)
+
+        return measurements, errors
+
+    def _scrape_sites(self, site_codes: list[str]) -> tuple[list[Measurement], int]:
+        """Scrape sites with one query each, issued concurrently.
+
+        Args:
+            site_codes: Station codes to scrape.
+
+        Returns:
+            Measurements in site order and the number of sites that errored.
+        """
         measurements: list[Measurement] = []
         errors = 0
 
-        # Process each site
-        for site_code in self.settings.site_codes:
+        # Wall time is bounded by the slowest request rather than the sum of
+        # all round-trips
+        with ThreadPoolExecutor(
+            max_workers=self.settings.max_concurrent_requests
+        ) as executor:
+            futures = [
+                executor.submit(self._scrape_site, site_code) for site_code in site_codes
+            ]
+
+        # Collect results in configured site order
+        for site_code, future in zip(site_codes, futures, strict=True):
             try:
-                measurement = self._scrape_site(site_code)
+                measurement = future.result()
                 if measurement:
                     measurements.append(measurement)
                 else:
-                    logger.warning(f"No data retrieved for site {site_code}")
+                    logger.warning("No data retrieved for site %s", site_code)
 
             except Exception as e:
-                logger.error(f"Error processing site {site_code}: {e}")
+                logger.error("Error processing site %s: %s", site_code, e)
                 errors += 1
                 continue
 
-        # Save results
-        if measurements:
-            new_count = self.csv_handler.save_measurements(measurements)
-            logger.info(
-                f"Completed: {len(measurements)} sites processed, "
-                f"{new_count} new records saved, {errors} errors"
-            )
-        else:
-            logger.warning("No measurements collected from any site")
+        return measurements, errors
 
     def _scrape_site(self, site_code: str) -> Measurement | None:
         """Scrape data for a single site.
@@ -79,7 +162,7 @@ class LindasHydroScraper:
         Returns:
             Measurement object or None if no data.
         """
-        logger.debug(f"Processing site {site_code}")
+        logger.debug("Processing site %s", site_code)
 
         # Build query
         query_params = QueryParameters(
@@ -90,7 +173,7 @@ class LindasHydroScraper:
         try:
             query = self.query_builder.build_query(query_params)
         except ValueError as e:
-            logger.error(f"Invalid parameters for site {site_code}: {e}")
+            logger.error("Invalid parameters for site %s: %s", site_code, e)
             return None
 
         # Execute query
@@ -102,7 +185,9 @@ class LindasHydroScraper:
         measurement = self.data_processor.process_results(results, site_code)
 
         if measurement:
-            logger.debug(f"Retrieved measurement for site {site_code}: {measurement.timestamp}")
+            logger.debug(
+                "Retrieved measurement for site %s: %s", site_code, measurement.timestamp
+            )
 
         return measurement
 
@@ -115,10 +200,15 @@ class LindasHydroScraper:
         try:
             removed = self.csv_handler.remove_duplicates()
             if removed > 0:
-                logger.info(f"Removed {removed} duplicate records")
+                logger.info("Removed %d duplicate records", removed)
             else:
                 logger.info("No duplicates found")
             return removed
         except Exception as e:
-            logger.error(f"Error cleaning duplicates: {e}")
+            logger.error("Error cleaning duplicates: %s", e)
             return 0
+
+    def close(self) -> None:
+        """Release network and file resources held by the scraper."""
+        self.sparql_client.close()
+        self.csv_handler.close()
@@ -1,7 +1,7 @@
 """Utility functions and helpers."""
 
 from .csv_handler import CsvHandler
-from .logging import setup_logging
+from .logging import setup_logging, stop_logging
 from .site_list_helper import get_river_station_codes
 
-__all__ = ["CsvHandler", "setup_logging", "get_river_station_codes"]
+__all__ = ["CsvHandler", "setup_logging", "stop_logging", "get_river_station_codes"]
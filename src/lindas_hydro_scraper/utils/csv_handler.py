@@ -1,16 +1,31 @@
 """CSV file handling for measurement data."""
 
+import contextlib
 import csv
 import logging
+import os
+import shutil
+import tempfile
 from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, TextIO
 
-import pandas as pd
+import orjson
 
 from ..core.constants import CSV_COLUMNS
 from ..models import Measurement
 
+if TYPE_CHECKING:
+    from _csv import Writer
+
 logger = logging.getLogger(__name__)
 
+# Chunk size for raw reads when counting records
+_READ_CHUNK_SIZE = 1 << 20
+
+# Buffer size for appends, so large batches reach disk in few writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
 
 class CsvHandler:
     """Handle CSV operations for measurement data."""
@@ -22,7 +37,14 @@ class CsvHandler:
             csv_path: Path to CSV file.
         """
         self.csv_path = csv_path
+        self.keys_path = csv_path.with_suffix(".keys.json")
+        # Exact key set rather than a probabilistic filter: a false positive
+        # would silently drop a new record, and keys stay small (one short
+        # string per row) at this scraper's write rate
         self._processed_keys: set[str] = set()
+        # Append handle and writer, opened on first save and kept open
+        self._file: TextIO | None = None
+        self._writer: Writer | None = None
         self._ensure_csv_exists()
         self._load_processed_keys()
 
@@ -31,28 +53,129 @@ class CsvHandler:
         if not self.csv_path.exists():
             self.csv_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-                writer.writeheader()
-            logger.info(f"Created new CSV file: {self.csv_path}")
+                writer = csv.writer(f)
+                writer.writerow(CSV_COLUMNS)
+            logger.info("Created new CSV file: %s", self.csv_path)
 
     def _load_processed_keys(self) -> None:
-        """Load existing record keys for duplicate detection."""
+        """Load existing record keys for duplicate detection.
+
+        Keys come from the sidecar index when it is at least as new as the
+        CSV; otherwise the CSV is scanned and the index rewritten.
+        """
+        if self._load_key_index():
+            return
+
         if self.csv_path.exists() and self.csv_path.stat().st_size > 0:
             try:
-                df = pd.read_csv(self.csv_path, dtype=str)
-                self._processed_keys = {
-                    f"{row['timestamp']}_{row['station_id']}"
-                    for _, row in df.iterrows()
-                    if pd.notna(row.get("timestamp")) and pd.notna(row.get("station_id"))
-                }
-                logger.debug(f"Loaded {len(self._processed_keys)} existing records")
+                with open(self.csv_path, newline="", encoding="utf-8") as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    ti = header.index("timestamp")
+                    si = header.index("station_id")
+                    width = max(ti, si)
+                    self._processed_keys = {
+                        f"{row[ti]}_{row[si]}"
+                        for row in reader
+                        if len(row) > width and row[ti] and row[si]
+                    }
+                logger.debug("Loaded %d existing records", len(self._processed_keys))
+                self._save_key_index()
             except Exception as e:
-                logger.error(f"Error loading existing records: {e}")
+                logger.error("Error loading existing records: %s", e)
                 self._processed_keys = set()
 
+    def _load_key_index(self) -> bool:
+        """Load processed keys from the sidecar index if it is current.
+
+        The index records the CSV's size and modification time when it was
+        written; it is only trusted if both still match exactly, so a CSV
+        replaced by another copy (even an older one) is rescanned.
+
+        Returns:
+            True if keys were loaded, False if the CSV must be scanned.
+        """
+        try:
+            stat = self.csv_path.stat()
+            index = orjson.loads(self.keys_path.read_bytes())
+            if (
+                index["csv_size"] != stat.st_size
+                or index["csv_mtime_ns"] != stat.st_mtime_ns
+            ):
+                return False
+            self._processed_keys = set(index["keys"])
+        except (OSError, orjson.JSONDecodeError, TypeError, KeyError):
+            return False
+
+        logger.debug(
+            "Loaded %d existing records from index", len(self._processed_keys)
+        )
+        return True
+
+    def _save_key_index(self) -> None:
+        """Persist processed keys to the sidecar index next to the CSV.
+
+        The CSV's current size and modification time are stored alongside
+        the keys so a later load can tell whether the index still applies.
+        """
+        tmp_path = self.keys_path.with_name(self.keys_path.name + ".tmp")
+        try:
+            stat = self.csv_path.stat()
+            index = {
+                "csv_size": stat.st_size,
+                "csv_mtime_ns": stat.st_mtime_ns,
+                "keys": list(self._processed_keys),
+            }
+            tmp_path.write_bytes(orjson.dumps(index))
+            os.replace(tmp_path, self.keys_path)
+        except OSError as e:
+            logger.warning("Error writing record key index: %s", e)
+            tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "CsvHandler":
+        """Return the handler for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Close the append handle on context exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the append handle if it is open."""
+        if self._file is not None:
+            # Reset first so a failing close cannot leave a dead handle behind
+            append_file, self._file, self._writer = self._file, None, None
+            append_file.close()
+
+    def _get_writer(self) -> tuple[TextIO, "Writer"]:
+        """Return the append handle and its CSV writer, opening them if needed.
+
+        Returns:
+            Open append handle and the csv writer bound to it.
+        """
+        if self._file is None or self._writer is None:
+            # Deliberately long-lived: kept open across saves, closed by close()
+            self._file = open(  # noqa: SIM115
+                self.csv_path,
+                "a",
+                newline="",
+                encoding="utf-8",
+                buffering=_WRITE_BUFFER_SIZE,
+            )
+            self._writer = csv.writer(self._file)
+        return self._file, self._writer
+
     def save_measurements(self, measurements: list[Measurement]) -> int:
         """Save measurements to CSV, skipping duplicates.
 
+        New rows are appended in a single buffered write, so callers should
+        pass a whole scrape batch rather than one measurement at a time.
+
         Args:
             measurements: List of measurements to save.
 
@@ -62,29 +185,49 @@ class CsvHandler:
         if not measurements:
             return 0
 
-        new_records = []
-
+        # Key each measurement once; the first of any in-batch duplicates wins
+        by_key: dict[str, Measurement] = {}
         for measurement in measurements:
-            # Check for duplicates
-            if measurement.unique_key not in self._processed_keys:
-                new_records.append(measurement.to_csv_dict())
-                self._processed_keys.add(measurement.unique_key)
+            by_key.setdefault(measurement.unique_key, measurement)
+
+        # Check for duplicates against saved records in one set operation,
+        # keeping rows in batch order
+        new_keys = by_key.keys() - self._processed_keys
+        new_records = [
+            measurement.to_csv_row()
+            for key, measurement in by_key.items()
+            if key in new_keys
+        ]
 
         if new_records:
             try:
-                with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-                    writer.writerows(new_records)
-                logger.info(f"Saved {len(new_records)} new records to {self.csv_path}")
+                append_file, writer = self._get_writer()
+                writer.writerows(new_records)
+                append_file.flush()
+                logger.info(
+                    "Saved %d new records to %s", len(new_records), self.csv_path
+                )
             except Exception as e:
-                logger.error(f"Error writing to CSV: {e}")
+                logger.error("Error writing to CSV: %s", e)
+                # Drop the handle so a partly buffered row is not reused; the
+                # keys stay unmarked so a later save retries these records
+                with contextlib.suppress(OSError):
+                    self.close()
                 return 0
 
+            # Only mark keys once their rows have reached the file
+            self._processed_keys |= new_keys
+            self._save_key_index()
+
         return len(new_records)
 
     def remove_duplicates(self) -> int:
         """Remove duplicate records from CSV file.
 
+        The file is streamed once into a temporary file next to it, keeping
+        the first row for each (timestamp, station_id) pair, which then
+        atomically replaces the original.
+
         Returns:
             Number of duplicates removed.
         """
@@ -92,37 +235,75 @@ class CsvHandler:
             logger.warning("CSV file does not exist")
             return 0
 
+        # The file is about to be replaced, so drop the handle to the old one
+        self.close()
+
+        tmp_path: Path | None = None
         try:
-            # Read CSV
-            df = pd.read_csv(self.csv_path, dtype=str)
-            initial_count = len(df)
+            with open(self.csv_path, newline="", encoding="utf-8") as src:
+                reader = csv.reader(src)
+                header = next(reader, None)
+                if header is None:
+                    return 0
+                ti = header.index("timestamp")
+                si = header.index("station_id")
+                width = max(ti, si)
 
-            # Remove duplicates
-            df_cleaned = df.drop_duplicates(subset=["timestamp", "station_id"], keep="first")
-            removed_count = initial_count - len(df_cleaned)
+                seen: set[tuple[str, str]] = set()
+                removed_count = 0
+                with tempfile.NamedTemporaryFile(
+                    "w",
+                    newline="",
+                    encoding="utf-8",
+                    dir=self.csv_path.parent,
+                    suffix=".tmp",
+                    delete=False,
+                ) as dst:
+                    tmp_path = Path(dst.name)
+                    writer = csv.writer(dst)
+                    writer.writerow(header)
+                    for row in reader:
+                        if len(row) > width:
+                            key = (row[ti], row[si])
+                            if key in seen:
+                                removed_count += 1
+                                continue
+                            seen.add(key)
+                        writer.writerow(row)
 
             if removed_count > 0:
-                # Save cleaned data
-                df_cleaned.to_csv(self.csv_path, index=False)
+                # Save cleaned data, keeping the original file's permissions
+                # rather than the temporary file's 0600
+                shutil.copymode(self.csv_path, tmp_path)
+                os.replace(tmp_path, self.csv_path)
+                tmp_path = None
 
                 # Update processed keys
                 self._processed_keys = {
-                    f"{row['timestamp']}_{row['station_id']}"
-                    for _, row in df_cleaned.iterrows()
-                    if pd.notna(row.get("timestamp")) and pd.notna(row.get("station_id"))
+                    f"{timestamp}_{station_id}"
+                    for timestamp, station_id in seen
+                    if timestamp and station_id
                 }
+                self._save_key_index()
 
-                logger.info(f"Removed {removed_count} duplicate records")
+                logger.info("Removed %d duplicate records", removed_count)
 
             return removed_count
 
         except Exception as e:
-            logger.error(f"Error removing duplicates: {e}")
+            logger.error("Error removing duplicates: %s", e)
             return 0
 
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
     def get_record_count(self) -> int:
         """Get total number of records in CSV.
 
+        Counts lines in raw chunks rather than parsing the file; records
+        never contain embedded newlines.
+
         Returns:
             Number of records.
         """
@@ -130,7 +311,18 @@ class CsvHandler:
             return 0
 
         try:
-            df = pd.read_csv(self.csv_path)
-            return len(df)
-        except Exception:
+            lines = 0
+            last_chunk = b""
+            with open(self.csv_path, "rb") as f:
+                for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b""):
+                    lines += chunk.count(b"\n")
+                    last_chunk = chunk
+
+            # Count a final line without a trailing newline
+            if last_chunk and not last_chunk.endswith(b"\n"):
+                lines += 1
+
+            # Exclude the header row
+            return max(0, lines - 1)
+        except OSError:
             return 0
@@ -1,11 +1,17 @@
 """Logging configuration utilities."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from ..core.constants import LOG_FORMAT
 
+# Listener writing queued records to the configured handlers
+_listener: QueueListener | None = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -14,11 +20,16 @@ def setup_logging(
 ) -> None:
     """Configure application logging.
 
+    Records are queued by the root logger and written to the output
+    handlers on a background thread, keeping log I/O off the caller.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR).
         log_file: Optional file path for log output.
         format_string: Log message format.
     """
+    global _listener
+
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
 
@@ -30,14 +41,44 @@ def setup_logging(
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
         handlers.append(file_handler)
 
+    formatter = logging.Formatter(format_string)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Flush and release handlers from any earlier configuration
+    stop_logging()
+
+    # The queue handler only merges message arguments; the output handlers
+    # apply the full format
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Configure root logger
     logging.basicConfig(
         level=numeric_level,
-        format=format_string,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True,  # Override any existing configuration
     )
 
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
     # Set specific loggers
-    logging.getLogger("SPARQLWrapper").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
+def stop_logging() -> None:
+    """Write out queued log records and close the output handlers."""
+    global _listener
+
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop_logging)
@@ -1,10 +1,14 @@
 """Helper utilities for extracting site lists from CSV files."""
 
+import io
 import logging
 from pathlib import Path
 
+import charset_normalizer
 import pandas as pd
 
+from ..models import SITE_CODE_RE
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,43 +34,67 @@ def get_river_station_codes(csv_file: Path | str) -> list[str]:
         raise FileNotFoundError(f"CSV file not found: {csv_path}")
 
     try:
-        # Read CSV with various encodings
-        for encoding in ["utf-8", "latin1", "cp1252"]:
-            try:
-                df = pd.read_csv(csv_path, encoding=encoding)
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            raise ValueError(f"Unable to read CSV file with any encoding: {csv_path}")
+        required_columns = {"lhg_code", "lhg_url"}
+
+        # Read the file once, decoding it with the detected encoding and
+        # parsing only the required columns as plain strings
+        df = pd.read_csv(
+            io.StringIO(_read_text(csv_path)),
+            usecols=lambda column: column in required_columns,
+            dtype=str,
+        )
 
         # Check required columns
-        required_columns = {"lhg_code", "lhg_url"}
         if not required_columns.issubset(df.columns):
             missing = required_columns - set(df.columns)
             raise ValueError(f"CSV missing required columns: {missing}")
 
-        # Filter for river stations
-        river_stations = df[df["lhg_code"] == "lhg_fluss"]["lhg_url"]
-
-        # Extract station codes (remove .htm extension)
-        station_codes = [
-            str(url).replace(".htm", "").strip()
-            for url in river_stations
-            if pd.notna(url)
-        ]
-
-        # Validate station codes are numeric
-        valid_codes = []
-        for code in station_codes:
-            try:
-                int(code)
-                valid_codes.append(code)
-            except ValueError:
-                logger.warning(f"Skipping invalid station code: {code}")
-
-        logger.info(f"Extracted {len(valid_codes)} river station codes from {csv_path}")
+        # Filter for river stations and strip the .htm extension
+        station_codes = (
+            df.loc[df["lhg_code"].eq("lhg_fluss"), "lhg_url"]
+            .dropna()
+            .astype(str)
+            .str.replace(".htm", "", regex=False)
+            .str.strip()
+        )
+
+        # Validate station codes with the same rule Settings applies
+        is_valid = station_codes.map(SITE_CODE_RE.fullmatch).notna()
+        invalid_codes = station_codes[~is_valid].tolist()
+        if invalid_codes:
+            logger.warning("Skipping invalid station codes: %s", invalid_codes)
+        valid_codes = station_codes[is_valid].tolist()
+
+        logger.info(
+            "Extracted %d river station codes from %s", len(valid_codes), csv_path
+        )
         return valid_codes
 
     except Exception as e:
         raise ValueError(f"Error processing CSV file: {e}") from e
+
+
+def _read_text(csv_path: Path) -> str:
+    """Read a text file, detecting its encoding when it is not UTF-8.
+
+    Args:
+        csv_path: Path to the file.
+
+    Returns:
+        Decoded file contents.
+
+    Raises:
+        ValueError: If no encoding can be detected.
+    """
+    raw = csv_path.read_bytes()
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+
+    match = charset_normalizer.from_bytes(raw).best()
+    if match is None:
+        raise ValueError(f"Unable to detect CSV file encoding: {csv_path}")
+
+    logger.debug("Detected %s encoding for %s", match.encoding, csv_path)
+    return str(match)
@@ -3,13 +3,13 @@
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_station_id():
     """Provide a sample station ID for testing."""
     return "STATION001"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sparql_endpoint():
     """Provide a sample SPARQL endpoint URL for testing."""
-    return "http://example.com/sparql"
\ No newline at end of file
+    return "http://example.com/sparql"
@@ -0,0 +1,41 @@
+"""Unit tests for Settings."""
+
+import pytest
+from pydantic import ValidationError
+
+from lindas_hydro_scraper.core.config import Settings
+
+
+class TestSettings:
+    """Test cases for Settings."""
+
+    def test_site_codes_from_comma_separated_string(self):
+        """Test parsing site codes from a comma-separated string."""
+        settings = Settings(site_codes="2044, 2112,,2491")
+
+        assert settings.site_codes == ["2044", "2112", "2491"]
+
+    def test_site_codes_invalid_are_aggregated(self):
+        """Test that all invalid site codes are reported together."""
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(site_codes=["2044", "abc", "10000"])
+
+        errors = exc_info.value.errors()
+        assert len(errors) == 1
+        assert "['abc', '10000']" in errors[0]["msg"]
+
+    @pytest.mark.parametrize("site_code", ["2044\n", " 2044", "0044", "2044a"])
+    def test_site_codes_must_match_exactly(self, site_code):
+        """Test that a code is rejected unless the whole string is valid."""
+        with pytest.raises(ValidationError):
+            Settings(site_codes=[site_code])
+
+    def test_output_path(self, tmp_path):
+        """Test that the output path follows directory and filename."""
+        settings = Settings(hydro_data_dir=str(tmp_path), output_filename="out.csv")
+
+        assert settings.output_path == tmp_path / "out.csv"
+
+        settings.output_filename = "other.csv"
+
+        assert settings.output_path == tmp_path / "other.csv"
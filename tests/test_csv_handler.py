@@ -0,0 +1,234 @@
+"""Unit tests for CsvHandler."""
+
+import csv
+import shutil
+import stat
+from datetime import datetime
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lindas_hydro_scraper.core.constants import CSV_COLUMNS
+from lindas_hydro_scraper.models import Measurement
+from lindas_hydro_scraper.utils.csv_handler import CsvHandler
+
+
+def make_measurement(station_id: str, hour: int, discharge: str = "1.5") -> Measurement:
+    """Create a measurement for the given station and hour."""
+    return Measurement(
+        station_id=station_id,
+        timestamp=datetime(2024, 1, 15, hour, 0, 0),
+        discharge=discharge,
+    )
+
+
+def read_rows(path) -> list[list[str]]:
+    """Read all rows of a CSV file, header included."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+class TestCsvHandler:
+    """Test cases for CsvHandler."""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        """Provide a path for a not yet existing CSV file."""
+        return tmp_path / "data" / "measurements.csv"
+
+    @pytest.fixture
+    def handler(self, csv_path):
+        """Create a CsvHandler writing to a fresh file."""
+        with CsvHandler(csv_path) as handler:
+            yield handler
+
+    def test_creates_file_with_header(self, handler, csv_path):
+        """Test that a new CSV file is created with the header row."""
+        assert read_rows(csv_path) == [CSV_COLUMNS]
+
+    def test_save_measurements_writes_rows(self, handler, csv_path):
+        """Test that measurements are appended in column order."""
+        saved = handler.save_measurements(
+            [make_measurement("2044", 10), make_measurement("2112", 10, "2.5")]
+        )
+
+        rows = read_rows(csv_path)
+        assert saved == 2
+        assert rows[1] == ["2024-01-15T10:00:00", "2044", "1.5", "", "", "", ""]
+        assert rows[2][1:3] == ["2112", "2.5"]
+
+    def test_save_measurements_skips_duplicates(self, handler, csv_path):
+        """Test that measurements already written are not saved again."""
+        handler.save_measurements([make_measurement("2044", 10)])
+        saved = handler.save_measurements(
+            [make_measurement("2044", 10), make_measurement("2044", 11)]
+        )
+
+        assert saved == 1
+        assert len(read_rows(csv_path)) == 3
+
+    def test_save_measurements_dedupes_within_batch(self, handler, csv_path):
+        """Test that in-batch duplicates keep the first row and batch order."""
+        saved = handler.save_measurements(
+            [
+                make_measurement("2044", 11, discharge="1.0"),
+                make_measurement("2044", 10, discharge="2.0"),
+                make_measurement("2044", 11, discharge="9.9"),
+            ]
+        )
+
+        rows = read_rows(csv_path)
+        assert saved == 2
+        assert [row[2] for row in rows[1:]] == ["1.0", "2.0"]
+
+    def test_save_measurements_empty(self, handler):
+        """Test that saving no measurements writes nothing."""
+        assert handler.save_measurements([]) == 0
+
+    def test_loads_existing_keys(self, handler, csv_path):
+        """Test that a new handler skips records already in the file."""
+        handler.save_measurements([make_measurement("2044", 10)])
+
+        reopened = CsvHandler(csv_path)
+
+        assert reopened.save_measurements([make_measurement("2044", 10)]) == 0
+
+    def test_key_index_written_after_save(self, handler, csv_path):
+        """Test that saved keys are persisted to the sidecar index."""
+        handler.save_measurements([make_measurement("2044", 10)])
+
+        assert handler.keys_path == csv_path.with_suffix(".keys.json")
+        assert handler.keys_path.exists()
+
+    def test_loads_keys_from_current_index(self, handler, csv_path):
+        """Test that a current index is used instead of scanning the CSV."""
+        handler.save_measurements([make_measurement("2044", 10)])
+
+        with patch("lindas_hydro_scraper.utils.csv_handler.csv.reader") as mock_reader:
+            reopened = CsvHandler(csv_path)
+
+        mock_reader.assert_not_called()
+        assert reopened.save_measurements([make_measurement("2044", 10)]) == 0
+
+    def test_rescans_when_csv_changed_after_index(self, handler, csv_path):
+        """Test that rows appended after the index was written are picked up."""
+        handler.save_measurements([make_measurement("2044", 10)])
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(
+                ["2024-01-15T11:00:00", "2044", "2.5", "", "", "", ""]
+            )
+
+        reopened = CsvHandler(csv_path)
+
+        assert reopened.save_measurements([make_measurement("2044", 11)]) == 0
+
+    def test_rescans_when_older_copy_restored(self, handler, csv_path, tmp_path):
+        """Test that an index newer than a restored CSV copy is not trusted."""
+        backup_path = tmp_path / "backup.csv"
+        shutil.copy2(csv_path, backup_path)
+        handler.save_measurements([make_measurement("2044", 10)])
+        handler.close()
+
+        # Restore the header-only backup, keeping its older modification time
+        shutil.copy2(backup_path, csv_path)
+
+        with CsvHandler(csv_path) as reopened:
+            assert reopened.save_measurements([make_measurement("2044", 10)]) == 1
+        assert len(read_rows(csv_path)) == 2
+
+    def test_remove_duplicates(self, handler, csv_path):
+        """Test that duplicate rows are dropped, keeping the first one."""
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["2024-01-15T10:00:00", "2044", "1.5", "", "", "", ""])
+            writer.writerow(["2024-01-15T10:00:00", "2044", "9.9", "", "", "", ""])
+            writer.writerow(["2024-01-15T11:00:00", "2044", "2.5", "", "", "", ""])
+
+        removed = handler.remove_duplicates()
+
+        rows = read_rows(csv_path)
+        assert removed == 1
+        assert [row[2] for row in rows[1:]] == ["1.5", "2.5"]
+        assert handler.save_measurements([make_measurement("2044", 11)]) == 0
+
+    def test_save_after_remove_duplicates_appends_to_new_file(self, handler, csv_path):
+        """Test that saves after a rewrite land in the replaced file."""
+        handler.save_measurements([make_measurement("2044", 10)])
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(
+                ["2024-01-15T10:00:00", "2044", "9.9", "", "", "", ""]
+            )
+
+        assert handler.remove_duplicates() == 1
+        assert handler.save_measurements([make_measurement("2044", 11)]) == 1
+        assert handler.get_record_count() == 2
+
+    def test_append_handle_reused_across_saves(self, handler, csv_path):
+        """Test that the file is opened once and closed by close()."""
+        handler.save_measurements([make_measurement("2044", 10)])
+        append_file = handler._file
+        handler.save_measurements([make_measurement("2044", 11)])
+
+        assert handler._file is append_file
+        assert len(read_rows(csv_path)) == 3
+
+        handler.close()
+
+        assert append_file.closed
+        assert handler._file is None
+
+    def test_failed_write_is_retried(self, handler, csv_path):
+        """Test that records from a failed write are saved by a later call."""
+        handler.save_measurements([make_measurement("2044", 10)])
+        append_file = handler._file
+        handler._writer = Mock(writerows=Mock(side_effect=OSError("Disk full")))
+
+        batch = [make_measurement("2044", 11), make_measurement("2112", 11)]
+        assert handler.save_measurements(batch) == 0
+        assert append_file.closed
+        assert handler._file is None
+
+        assert handler.save_measurements(batch) == 2
+        assert [row[1] for row in read_rows(csv_path)[1:]] == ["2044", "2044", "2112"]
+
+    def test_remove_duplicates_keeps_file_mode(self, handler, csv_path):
+        """Test that rewriting the file keeps its permission bits."""
+        handler.save_measurements([make_measurement("2044", 10)])
+        with open(csv_path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(
+                ["2024-01-15T10:00:00", "2044", "9.9", "", "", "", ""]
+            )
+        csv_path.chmod(0o644)
+
+        assert handler.remove_duplicates() == 1
+        assert stat.S_IMODE(csv_path.stat().st_mode) == 0o644
+
+    def test_remove_duplicates_leaves_no_temp_file(self, handler, csv_path):
+        """Test that the temporary file is cleaned up when nothing is removed."""
+        handler.save_measurements([make_measurement("2044", 10)])
+
+        assert handler.remove_duplicates() == 0
+        assert not list(csv_path.parent.glob("*.tmp"))
+
+    def test_remove_duplicates_missing_file(self, handler, csv_path):
+        """Test that a missing file reports no duplicates."""
+        csv_path.unlink()
+
+        assert handler.remove_duplicates() == 0
+
+    def test_get_record_count(self, handler):
+        """Test that the record count excludes the header."""
+        assert handler.get_record_count() == 0
+
+        handler.save_measurements(
+            [make_measurement("2044", 10), make_measurement("2044", 11)]
+        )
+
+        assert handler.get_record_count() == 2
+
+    def test_get_record_count_without_trailing_newline(self, handler, csv_path):
+        """Test that a last line without newline is still counted."""
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("2024-01-15T10:00:00,2044,1.5,,,,")
+
+        assert handler.get_record_count() == 1
@@ -1,13 +1,12 @@
 """Unit tests for DataProcessor."""
 
 from datetime import datetime
-from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from lindas_hydro_scraper.core.data_processor import DataProcessor
-from lindas_hydro_scraper.models import Measurement
+from lindas_hydro_scraper.models import Measurement, Parameter
 
 
 class TestDataProcessor:
@@ -59,9 +58,9 @@ class TestDataProcessor:
 
         assert isinstance(result, Measurement)
         assert result.station_id == station_id
-        assert result.discharge == Decimal("123.45")
-        assert result.water_level == Decimal("456.78")
-        assert result.water_temperature == Decimal("15.5")
+        assert result.discharge == "123.45"
+        assert result.water_level == "456.78"
+        assert result.water_temperature == "15.5"
         assert result.danger_level == 3
         assert result.is_liter is False
 
@@ -243,7 +242,9 @@ class TestDataProcessor:
         """Test that warning is logged for invalid results structure."""
         processor.process_results({}, "STATION001")
 
-        mock_logger.warning.assert_called_with("Invalid results structure for station STATION001")
+        mock_logger.warning.assert_called_with(
+            "Invalid results structure for station %s", "STATION001"
+        )
 
     @patch("lindas_hydro_scraper.core.data_processor.logger")
     def test_process_results_logs_warning_no_timestamp(self, mock_logger, processor):
@@ -260,7 +261,9 @@ class TestDataProcessor:
         }
         processor.process_results(results, "STATION001")
 
-        mock_logger.warning.assert_called_with("No timestamp found for station STATION001")
+        mock_logger.warning.assert_called_with(
+            "No timestamp found for station %s", "STATION001"
+        )
 
     @patch("lindas_hydro_scraper.core.data_processor.logger")
     def test_process_results_logs_warning_no_measurements(self, mock_logger, processor):
@@ -277,7 +280,9 @@ class TestDataProcessor:
         }
         processor.process_results(results, "STATION001")
 
-        mock_logger.warning.assert_called_with("No valid measurements found for station STATION001")
+        mock_logger.warning.assert_called_with(
+            "No valid measurements found for station %s", "STATION001"
+        )
 
     @patch("lindas_hydro_scraper.core.data_processor.logger")
     def test_process_results_logs_error_on_exception(self, mock_logger, processor):
@@ -299,5 +304,69 @@ class TestDataProcessor:
         processor.process_results(results, "STATION001")
 
         assert mock_logger.error.called
-        error_call = mock_logger.error.call_args[0][0]
-        assert "Error creating measurement for station STATION001" in error_call
\ No newline at end of file
+        error_args = mock_logger.error.call_args[0]
+        assert "Error creating measurement for station STATION001" in (
+            error_args[0] % error_args[1:]
+        )
+
+    def test_map_predicate_to_field_lindas_uri(self, processor):
+        """Test mapping of LINDAS parameter URIs to field names."""
+        assert processor._map_predicate_to_field(Parameter.DISCHARGE.uri) == "discharge"
+        assert processor._map_predicate_to_field(Parameter.IS_LITER.uri) == "is_liter"
+        assert processor._map_predicate_to_field(Parameter.STATION.uri) is None
+
+    def test_map_predicate_to_field_caches_parsed_uri(self, processor):
+        """Test that parsed URIs are remembered for later lookups."""
+        uri = "http://example.com/dimension/waterLevel"
+
+        with patch.object(
+            processor, "_parse_predicate", wraps=processor._parse_predicate
+        ) as mock_parse:
+            assert processor._map_predicate_to_field(uri) == "water_level"
+            assert processor._map_predicate_to_field(uri) == "water_level"
+
+        mock_parse.assert_called_once_with(uri)
+
+    def test_process_batch_results_groups_by_subject(self, processor):
+        """Test that batch bindings are split into one measurement per station."""
+        base = "http://example.com/river/observation"
+
+        def binding(site, predicate, value):
+            return {
+                "subject": {"value": f"{base}/{site}"},
+                "predicate": {"value": f"http://example.com/dimension/{predicate}"},
+                "object": {"value": value},
+            }
+
+        results = {
+            "results": {
+                "bindings": [
+                    binding("2044", "measurementTime", "2024-01-15T10:30:00Z"),
+                    binding("2112", "measurementTime", "2024-01-15T10:40:00Z"),
+                    binding("2044", "discharge", "123.45"),
+                    binding("2112", "waterLevel", "456.78"),
+                    binding("2491", "measurementTime", "2024-01-15T10:50:00Z"),
+                ]
+            }
+        }
+
+        measurements = processor.process_batch_results(results)
+
+        assert set(measurements) == {"2044", "2112"}
+        assert measurements["2044"].station_id == "2044"
+        assert measurements["2044"].discharge == "123.45"
+        assert measurements["2112"].water_level == "456.78"
+
+    def test_process_batch_results_invalid_structure(self, processor):
+        """Test that an invalid batch result yields no measurements."""
+        assert processor.process_batch_results({}) == {}
+
+    def test_extract_data_stops_when_all_fields_found(self, processor, valid_sparql_results):
+        """Test that bindings after the last known field are not inspected."""
+        trailing = MagicMock()
+        valid_sparql_results["results"]["bindings"].append(trailing)
+
+        data = processor._extract_data(valid_sparql_results, "STATION001")
+
+        assert len(data) == 7
+        trailing.__getitem__.assert_not_called()
@@ -0,0 +1,165 @@
+"""Unit tests for LindasHydroScraper."""
+
+import csv
+import logging
+import re
+from functools import partial
+from unittest.mock import Mock, patch
+
+import orjson
+import pytest
+import requests
+
+from lindas_hydro_scraper.core import Settings
+from lindas_hydro_scraper.models import Parameter
+from lindas_hydro_scraper.scrapers.lindas_scraper import LindasHydroScraper
+
+SUBJECT_PATTERN = re.compile(r"/river/observation/(\d+)>")
+
+
+def make_response(bindings: list[dict]) -> Mock:
+    """Create a mock HTTP response carrying SPARQL JSON bindings."""
+    response = Mock()
+    response.content = orjson.dumps({"results": {"bindings": bindings}})
+    return response
+
+
+def site_bindings(site_code: str, with_subject: bool) -> list[dict]:
+    """Create timestamp and discharge bindings for a site."""
+    values = [
+        (Parameter.MEASUREMENT_TIME.uri, "2024-01-15T10:00:00Z"),
+        (Parameter.DISCHARGE.uri, f"{site_code}.5"),
+    ]
+    bindings = []
+    for predicate, value in values:
+        binding = {"predicate": {"value": predicate}, "object": {"value": value}}
+        if with_subject:
+            binding["subject"] = {
+                "value": f"https://environment.ld.admin.ch/foen/hydro/river/observation/{site_code}"
+            }
+        bindings.append(binding)
+    return bindings
+
+
+class FakeEndpoint:
+    """Answer SPARQL POSTs, failing batch queries that include given sites."""
+
+    def __init__(self, failing_sites: frozenset[str] = frozenset()) -> None:
+        self.failing_sites = failing_sites
+        self.batch_queries: list[list[str]] = []
+        self.site_queries: list[str] = []
+
+    def post(self, url: str, data: dict, timeout: float) -> Mock:
+        query = data["query"]
+        if "LIMIT 1" in query:
+            return make_response([{"s": {"value": "http://example.com/s"}}])
+
+        site_codes = SUBJECT_PATTERN.findall(query)
+        if "VALUES ?subject" in query:
+            self.batch_queries.append(site_codes)
+            if self.failing_sites.intersection(site_codes):
+                raise requests.ConnectionError("Connection reset")
+            return make_response(
+                [
+                    b
+                    for code in site_codes
+                    for b in site_bindings(code, with_subject=True)
+                ]
+            )
+
+        self.site_queries.extend(site_codes)
+        return make_response(site_bindings(site_codes[0], with_subject=False))
+
+
+class TestLindasHydroScraper:
+    """Test cases for LindasHydroScraper.run."""
+
+    @pytest.fixture
+    def mock_session(self):
+        """Create a mock requests.Session."""
+        with patch("lindas_hydro_scraper.core.sparql_client.requests.Session") as mock:
+            yield mock
+
+    @pytest.fixture
+    def make_scraper(self, tmp_path, mock_session):
+        """Build scrapers for given sites against a fake endpoint."""
+        scrapers = []
+
+        def make(site_codes: list[str], endpoint: FakeEndpoint) -> LindasHydroScraper:
+            mock_session.return_value.post.side_effect = endpoint.post
+            settings = Settings(
+                site_codes=site_codes,
+                hydro_data_dir=tmp_path,
+                retry_max_attempts=1,
+            )
+            scraper = LindasHydroScraper(settings)
+            scrapers.append(scraper)
+            return scraper
+
+        yield make
+
+        for scraper in scrapers:
+            scraper.close()
+
+    def read_saved(self, scraper: LindasHydroScraper) -> list[tuple[str, str]]:
+        """Read (station_id, discharge) pairs saved to the output CSV."""
+        with open(scraper.settings.output_path, newline="", encoding="utf-8") as f:
+            return [(row["station_id"], row["discharge"]) for row in csv.DictReader(f)]
+
+    def test_batch_success(self, make_scraper):
+        """Test that several sites are fetched with one batch query."""
+        endpoint = FakeEndpoint()
+        scraper = make_scraper(["2044", "2112", "2135"], endpoint)
+
+        scraper.run()
+
+        assert endpoint.batch_queries == [["2044", "2112", "2135"]]
+        assert endpoint.site_queries == []
+        assert self.read_saved(scraper) == [
+            ("2044", "2044.5"),
+            ("2112", "2112.5"),
+            ("2135", "2135.5"),
+        ]
+
+    def test_failed_chunk_falls_back_per_site(self, make_scraper, caplog):
+        """Test that only a failed chunk's sites are queried one by one."""
+        endpoint = FakeEndpoint(failing_sites=frozenset({"2135"}))
+        scraper = make_scraper(["2044", "2112", "2135", "2016", "2099"], endpoint)
+        scraper.query_builder.build_batch_queries = partial(
+            scraper.query_builder.build_batch_queries, chunk_size=2
+        )
+
+        with caplog.at_level(logging.INFO):
+            scraper.run()
+
+        assert sorted(endpoint.batch_queries) == [
+            ["2044", "2112"],
+            ["2099"],
+            ["2135", "2016"],
+        ]
+        assert sorted(endpoint.site_queries) == ["2016", "2135"]
+        assert [station for station, _ in self.read_saved(scraper)] == [
+            "2044",
+            "2112",
+            "2135",
+            "2016",
+            "2099",
+        ]
+        assert "5 sites processed, 5 new records saved, 0 errors" in caplog.text
+        assert [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == "lindas_hydro_scraper.scrapers.lindas_scraper"
+            and record.levelno == logging.WARNING
+        ] == ["Batch query failed for 2 sites, querying them individually"]
+
+    def test_single_site_uses_site_query(self, make_scraper):
+        """Test that a single configured site skips the batch query."""
+        endpoint = FakeEndpoint()
+        scraper = make_scraper(["2044"], endpoint)
+
+        scraper.run()
+
+        assert endpoint.batch_queries == []
+        assert endpoint.site_queries == ["2044"]
+        assert self.read_saved(scraper) == [("2044", "2044.5")]
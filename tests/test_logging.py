@@ -0,0 +1,40 @@
+"""Unit tests for logging configuration."""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from lindas_hydro_scraper.utils import setup_logging, stop_logging
+
+
+class TestSetupLogging:
+    """Test cases for setup_logging."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        """Restore the root logger configuration after each test."""
+        root = logging.getLogger()
+        handlers, level = root.handlers[:], root.level
+        yield
+        stop_logging()
+        root.handlers[:] = handlers
+        root.setLevel(level)
+
+    def test_root_logger_uses_queue_handler(self):
+        """Test that the root logger only enqueues records."""
+        setup_logging(level="DEBUG")
+
+        root = logging.getLogger()
+        assert root.level == logging.DEBUG
+        assert [type(h) for h in root.handlers] == [QueueHandler]
+
+    def test_records_written_to_log_file(self, tmp_path):
+        """Test that queued records are formatted once into the log file."""
+        log_file = tmp_path / "logs" / "scraper.log"
+        setup_logging(log_file=log_file, format_string="%(levelname)s %(message)s")
+
+        logging.getLogger("lindas_hydro_scraper.test").info("Saved %d records", 3)
+        stop_logging()
+
+        assert log_file.read_text(encoding="utf-8") == "INFO Saved 3 records\n"
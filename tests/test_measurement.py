@@ -8,6 +8,9 @@ from pydantic import ValidationError
 
 from lindas_hydro_scraper.models.measurement import Measurement
 
+# Fixed timestamp for tests where the time itself does not matter
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestMeasurement:
     """Test cases for Measurement model."""
@@ -26,9 +29,9 @@ class TestMeasurement:
 
         assert measurement.station_id == "STATION001"
         assert measurement.timestamp == datetime(2024, 1, 15, 10, 30, 0)
-        assert measurement.discharge == Decimal("123.45")
-        assert measurement.water_level == Decimal("456.78")
-        assert measurement.water_temperature == Decimal("15.5")
+        assert measurement.discharge == "123.45"
+        assert measurement.water_level == "456.78"
+        assert measurement.water_temperature == "15.5"
         assert measurement.danger_level == 3
         assert measurement.is_liter is False
 
@@ -51,35 +54,35 @@ class TestMeasurement:
         """Test decimal parsing from string values."""
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             discharge="123.45",
             water_level="456.78",
             water_temperature="15.5",
         )
 
-        assert measurement.discharge == Decimal("123.45")
-        assert measurement.water_level == Decimal("456.78")
-        assert measurement.water_temperature == Decimal("15.5")
+        assert measurement.discharge == "123.45"
+        assert measurement.water_level == "456.78"
+        assert measurement.water_temperature == "15.5"
 
     def test_parse_decimal_from_float(self):
         """Test decimal parsing from float values."""
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             discharge=123.45,
             water_level=456.78,
             water_temperature=15.5,
         )
 
-        assert measurement.discharge == Decimal("123.45")
-        assert measurement.water_level == Decimal("456.78")
-        assert measurement.water_temperature == Decimal("15.5")
+        assert measurement.discharge == "123.45"
+        assert measurement.water_level == "456.78"
+        assert measurement.water_temperature == "15.5"
 
     def test_parse_decimal_invalid_values(self):
         """Test decimal parsing with invalid values returns None."""
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             discharge="invalid",
             water_level="not_a_number",
             water_temperature="",
@@ -89,6 +92,36 @@ class TestMeasurement:
         assert measurement.water_level is None
         assert measurement.water_temperature is None
 
+    def test_parse_decimal_number_forms(self):
+        """Test that signed and exponent forms are kept and non-finite dropped."""
+        measurement = Measurement(
+            station_id="STATION001",
+            timestamp=_NOW,
+            discharge=" -1.5e3 ",
+            water_level=Decimal("1E+2"),
+            water_temperature="nan",
+        )
+
+        assert measurement.discharge == "-1.5e3"
+        assert measurement.water_level == "1E+2"
+        assert measurement.water_temperature is None
+
+    @pytest.mark.parametrize("value", ["\u0661\u0662", "\uff11\uff12", "1.\u0665"])
+    def test_parse_decimal_rejects_non_ascii_digits(self, value):
+        """Test that Unicode digits outside ASCII are not accepted as numbers."""
+        measurement = Measurement(
+            station_id="STATION001", timestamp=_NOW, discharge=value
+        )
+
+        assert measurement.discharge is None
+
+    def test_now_accepted(self):
+        """Test that a current, real-clock timestamp is accepted."""
+        now = datetime.now()
+        measurement = Measurement(station_id="STATION001", timestamp=now)
+
+        assert measurement.timestamp == now
+
     def test_parse_timestamp_from_iso_string(self):
         """Test timestamp parsing from ISO format string."""
         iso_timestamp = "2024-01-15T10:30:00+00:00"
@@ -129,7 +162,7 @@ class TestMeasurement:
         for level in range(0, 6):
             measurement = Measurement(
                 station_id="STATION001",
-                timestamp=datetime.now(),
+                timestamp=_NOW,
                 danger_level=level,
             )
             assert measurement.danger_level == level
@@ -139,7 +172,7 @@ class TestMeasurement:
             with pytest.raises(ValidationError) as exc_info:
                 Measurement(
                     station_id="STATION001",
-                    timestamp=datetime.now(),
+                    timestamp=_NOW,
                     danger_level=invalid_level,
                 )
 
@@ -152,7 +185,7 @@ class TestMeasurement:
         # With discharge only
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             discharge=Decimal("100"),
         )
         assert measurement.has_measurements() is True
@@ -160,7 +193,7 @@ class TestMeasurement:
         # With water level only
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             water_level=Decimal("200"),
         )
         assert measurement.has_measurements() is True
@@ -168,7 +201,7 @@ class TestMeasurement:
         # With water temperature only
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             water_temperature=Decimal("15"),
         )
         assert measurement.has_measurements() is True
@@ -176,7 +209,7 @@ class TestMeasurement:
         # With all measurements
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             discharge=Decimal("100"),
             water_level=Decimal("200"),
             water_temperature=Decimal("15"),
@@ -187,7 +220,7 @@ class TestMeasurement:
         """Test has_measurements returns False when no measurements exist."""
         measurement = Measurement(
             station_id="STATION001",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
             danger_level=3,
             is_liter=True,
         )
@@ -238,6 +271,39 @@ class TestMeasurement:
             "is_liter": None,
         }
 
+    def test_to_csv_row_matches_csv_columns(self):
+        """Test that row values line up with CSV_COLUMNS."""
+        measurement = Measurement(
+            station_id="STATION001",
+            timestamp=datetime(2024, 1, 15, 10, 30, 0),
+            discharge="123.45",
+            water_level="456.78",
+            water_temperature="15.5",
+            danger_level=3,
+            is_liter=True,
+        )
+
+        # Expected values in CSV_COLUMNS order
+        assert measurement.to_csv_row() == (
+            "2024-01-15T10:30:00",
+            "STATION001",
+            "123.45",
+            "456.78",
+            "3",
+            "15.5",
+            "true",
+        )
+
+    def test_to_csv_row_cached(self):
+        """Test that the formatted row is built once and reused."""
+        measurement = Measurement(
+            station_id="STATION001",
+            timestamp=datetime(2024, 1, 15, 10, 30, 0),
+            discharge="123.45",
+        )
+
+        assert measurement.to_csv_row() is measurement.to_csv_row()
+
     def test_unique_key_generation(self):
         """Test unique key generation for deduplication."""
         timestamp = datetime(2024, 1, 15, 10, 30, 0)
@@ -249,11 +315,51 @@ class TestMeasurement:
         expected_key = f"{timestamp.isoformat()}_STATION001"
         assert measurement.unique_key == expected_key
 
+    def test_unique_key_cached_on_frozen_model(self):
+        """Test that the key is computed once and fields cannot change."""
+        measurement = Measurement(
+            station_id="STATION001",
+            timestamp=datetime(2024, 1, 15, 10, 30, 0),
+        )
+
+        assert measurement.unique_key is measurement.unique_key
+        with pytest.raises(ValidationError):
+            measurement.station_id = "STATION002"
+
+    def test_model_copy_with_update_recomputes_unique_key(self):
+        """Test that an updated copy does not reuse the original's cached key."""
+        measurement = Measurement(station_id="2044", timestamp=_NOW)
+        original_key = measurement.unique_key
+
+        copy = measurement.model_copy(update={"station_id": "2112"})
+
+        assert copy.unique_key == f"{_NOW.isoformat()}_2112"
+        assert measurement.unique_key == original_key
+        assert measurement.model_copy().unique_key == original_key
+
+    def test_model_copy_with_update_recomputes_csv_row(self):
+        """Test that an updated copy does not reuse the original's cached row."""
+        measurement = Measurement(station_id="2044", timestamp=_NOW, discharge="1.5")
+        original_row = measurement.to_csv_row()
+
+        copy = measurement.model_copy(update={"station_id": "2112", "discharge": "9"})
+
+        assert copy.to_csv_row()[1:3] == ("2112", "9")
+        assert measurement.to_csv_row() == original_row
+
+    def test_station_id_interned(self):
+        """Test that equal station IDs share one string object."""
+        station_id = "".join(["STATION", "001"])
+        validated = Measurement(station_id=f" {station_id} ", timestamp=_NOW)
+        raw = Measurement.from_raw(station_id, {"timestamp": "2024-01-15T10:30:00Z"})
+
+        assert validated.station_id is raw.station_id
+
     def test_str_strip_whitespace(self):
         """Test that string fields have whitespace stripped."""
         measurement = Measurement(
             station_id="  STATION001  ",
-            timestamp=datetime.now(),
+            timestamp=_NOW,
         )
 
         assert measurement.station_id == "STATION001"
@@ -269,7 +375,67 @@ class TestMeasurement:
     def test_station_id_required(self):
         """Test that station_id is required."""
         with pytest.raises(ValidationError) as exc_info:
-            Measurement(timestamp=datetime.now())
+            Measurement(timestamp=_NOW)
 
         errors = exc_info.value.errors()
-        assert any("station_id" in str(error) for error in errors)
\ No newline at end of file
+        assert any("station_id" in str(error) for error in errors)
+
+    def test_from_raw_matches_validated_model(self):
+        """Test that from_raw builds the same measurement as full validation."""
+        raw = {
+            "timestamp": "2024-01-15T10:30:00Z",
+            "discharge": "123.45",
+            "water_level": "456.78",
+            "water_temperature": "",
+            "danger_level": "3",
+            "is_liter": "false",
+        }
+
+        measurement = Measurement.from_raw(" STATION001 ", raw)
+
+        assert measurement == Measurement(station_id="STATION001", **raw)
+        assert measurement.water_temperature is None
+
+    def test_from_raw_danger_level_and_flag_forms(self):
+        """Test that from_raw parses common and padded level and flag values."""
+        for raw_level, raw_flag, level, flag in [
+            ("0", "true", 0, True),
+            (5, "FALSE", 5, False),
+            (" 2 ", " yes ", 2, True),
+            ("2.0", "no", 2, False),
+            (3.0, "1", 3, True),
+            (None, "maybe", None, None),
+        ]:
+            measurement = Measurement.from_raw(
+                "STATION001",
+                {
+                    "timestamp": "2024-01-15T10:30:00Z",
+                    "danger_level": raw_level,
+                    "is_liter": raw_flag,
+                },
+            )
+
+            assert measurement.danger_level == level
+            assert measurement.is_liter is flag
+
+        # Fractional levels are rejected rather than truncated
+        with pytest.raises(ValueError):
+            Measurement.from_raw(
+                "STATION001",
+                {"timestamp": "2024-01-15T10:30:00Z", "danger_level": 2.5},
+            )
+
+    @pytest.mark.parametrize("danger_level", ["6", "-1", 2.5, "2.5", "abc"])
+    def test_from_raw_invalid_danger_level(self, danger_level):
+        """Test that from_raw rejects out-of-range and fractional danger levels."""
+        raw = {"timestamp": "2024-01-15T10:30:00Z", "danger_level": danger_level}
+
+        with pytest.raises(ValueError):
+            Measurement.from_raw("STATION001", raw)
+        with pytest.raises(ValidationError):
+            Measurement(station_id="STATION001", **raw)
+
+    def test_from_raw_invalid_timestamp(self):
+        """Test that from_raw rejects unparseable timestamps."""
+        with pytest.raises(ValueError):
+            Measurement.from_raw("STATION001", {"timestamp": "invalid_timestamp"})
@@ -0,0 +1,135 @@
+"""Unit tests for SparqlQueryBuilder."""
+
+import pytest
+from pydantic import ValidationError
+
+from lindas_hydro_scraper.core.query_builder import SparqlQueryBuilder
+from lindas_hydro_scraper.models import Parameter, QueryParameters
+
+
+class TestSparqlQueryBuilder:
+    """Test cases for SparqlQueryBuilder."""
+
+    @pytest.fixture
+    def builder(self):
+        """Create a SparqlQueryBuilder instance."""
+        return SparqlQueryBuilder(base_url="http://example.com/hydro")
+
+    def test_build_query_binds_site_subject(self, builder):
+        """Test that the query binds the station observation as subject."""
+        query = builder.build_query(QueryParameters(site_code="2044"))
+
+        assert (
+            "BIND(<http://example.com/hydro/river/observation/2044> AS ?subject)"
+            in query
+        )
+
+    def test_build_query_filters_parameters(self, builder):
+        """Test that only the requested parameters appear in the FILTER clause."""
+        params = QueryParameters(
+            site_code="2044",
+            parameters=[Parameter.DISCHARGE, Parameter.IS_LITER],
+        )
+        query = builder.build_query(params)
+
+        assert f"<{Parameter.DISCHARGE.uri}>" in query
+        assert "<http://example.com/isLiter>" in query
+        assert f"<{Parameter.WATER_LEVEL.uri}>" not in query
+
+    def test_build_query_reuses_template(self, builder):
+        """Test that the template is built once per parameter set."""
+        first = builder.build_query(QueryParameters(site_code="2044"))
+        second = builder.build_query(QueryParameters(site_code="2112"))
+
+        assert len(builder._templates) == 1
+        assert first.replace("2044", "2112") == second
+
+    def test_build_query_prepares_template_from_init(self):
+        """Test that parameters passed at init are prepared up front."""
+        builder = SparqlQueryBuilder(parameters=list(Parameter))
+
+        assert len(builder._templates) == 1
+        builder.build_query(QueryParameters(site_code="2044"))
+        assert len(builder._templates) == 1
+
+    def test_build_query_new_parameter_set(self, builder):
+        """Test that a different parameter set gets its own template."""
+        builder.build_query(QueryParameters(site_code="2044"))
+        query = builder.build_query(
+            QueryParameters(site_code="2044", parameters=[Parameter.DISCHARGE])
+        )
+
+        assert len(builder._templates) == 2
+        assert f"<{Parameter.WATER_LEVEL.uri}>" not in query
+
+    @pytest.mark.parametrize("site_code", ["", "abc", "0", "0044", "10000"])
+    def test_query_parameters_invalid_site_code(self, site_code):
+        """Test that invalid site codes are rejected when parameters are built."""
+        with pytest.raises(ValidationError):
+            QueryParameters(site_code=site_code)
+
+    def test_build_query_requires_parameters(self, builder):
+        """Test that an empty parameter list is rejected."""
+        with pytest.raises(ValueError):
+            builder.build_query(QueryParameters(site_code="2044", parameters=[]))
+
+    def test_build_batch_query_lists_all_subjects(self, builder):
+        """Test that every site appears in the VALUES clause."""
+        query = builder.build_batch_query(["2044", "2112"], list(Parameter))
+
+        assert "SELECT ?subject ?predicate ?object" in query
+        assert (
+            "VALUES ?subject { <http://example.com/hydro/river/observation/2044> "
+            "<http://example.com/hydro/river/observation/2112> }"
+        ) in query
+        assert f"<{Parameter.DISCHARGE.uri}>" in query
+
+    @pytest.mark.parametrize(
+        ("site_codes", "parameters"),
+        [
+            ([], list(Parameter)),
+            (["2044"], []),
+            (["2044", "2112> <http://example.com/x"], list(Parameter)),
+            (["2044\n"], list(Parameter)),
+            (["0044"], list(Parameter)),
+        ],
+    )
+    def test_build_batch_query_invalid(self, builder, site_codes, parameters):
+        """Test that invalid batch inputs are rejected."""
+        with pytest.raises(ValueError):
+            builder.build_batch_query(site_codes, parameters)
+
+    def test_build_batch_queries_chunks_sites(self, builder):
+        """Test that sites are split into one query per chunk, in order."""
+        site_codes = ["2044", "2112", "2135", "2016", "2099"]
+
+        batches = builder.build_batch_queries(site_codes, list(Parameter), chunk_size=2)
+
+        assert [chunk for chunk, _ in batches] == [
+            ["2044", "2112"],
+            ["2135", "2016"],
+            ["2099"],
+        ]
+        for chunk, query in batches:
+            assert query == builder.build_batch_query(chunk, list(Parameter))
+
+    @pytest.mark.parametrize(
+        ("site_codes", "chunk_size"),
+        [
+            ([], 2),
+            (["2044"], 0),
+        ],
+    )
+    def test_build_batch_queries_invalid(self, builder, site_codes, chunk_size):
+        """Test that empty site lists and non-positive chunk sizes are rejected."""
+        with pytest.raises(ValueError):
+            builder.build_batch_queries(
+                site_codes, list(Parameter), chunk_size=chunk_size
+            )
+
+    def test_build_query_reuses_rendered_query(self, builder):
+        """Test that repeated builds for a site return the cached string."""
+        first = builder.build_query(QueryParameters(site_code="2044"))
+        second = builder.build_query(QueryParameters(site_code="2044"))
+
+        assert first is second
@@ -0,0 +1,73 @@
+"""Unit tests for site list helpers."""
+
+import pytest
+
+from lindas_hydro_scraper.utils.site_list_helper import get_river_station_codes
+
+STATIONS_CSV = (
+    "lhg_name,lhg_code,lhg_url\n"
+    "Zürich,lhg_fluss,2099.htm\n"
+    "Genève,lhg_see,2027.htm\n"
+    "Basel,lhg_fluss,2289.htm\n"
+)
+
+
+class TestGetRiverStationCodes:
+    """Test cases for get_river_station_codes."""
+
+    def test_utf8_file(self, tmp_path):
+        """Test extracting river codes from a UTF-8 file."""
+        csv_file = tmp_path / "stations.csv"
+        csv_file.write_text(STATIONS_CSV, encoding="utf-8")
+
+        assert get_river_station_codes(csv_file) == ["2099", "2289"]
+
+    def test_non_utf8_file(self, tmp_path):
+        """Test that a legacy-encoded file is detected and decoded."""
+        csv_file = tmp_path / "stations.csv"
+        csv_file.write_bytes(STATIONS_CSV.encode("cp1252"))
+
+        assert get_river_station_codes(csv_file) == ["2099", "2289"]
+
+    def test_missing_file(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            get_river_station_codes(tmp_path / "missing.csv")
+
+    def test_missing_columns(self, tmp_path):
+        """Test that missing required columns raise ValueError."""
+        csv_file = tmp_path / "stations.csv"
+        csv_file.write_text("lhg_name,lhg_code\nZürich,lhg_fluss\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="missing required columns"):
+            get_river_station_codes(csv_file)
+
+    def test_skips_invalid_codes(self, tmp_path):
+        """Test that non-integer codes are dropped and order is kept."""
+        csv_file = tmp_path / "stations.csv"
+        csv_file.write_text(
+            "lhg_code,lhg_url\n"
+            "lhg_fluss, 2135.htm \n"
+            "lhg_fluss,abc.htm\n"
+            "lhg_fluss,\n"
+            "lhg_fluss,12.5.htm\n"
+            "lhg_fluss,2016.htm\n",
+            encoding="utf-8",
+        )
+
+        assert get_river_station_codes(csv_file) == ["2135", "2016"]
+
+    def test_skips_signed_and_zero_padded_codes(self, tmp_path):
+        """Test that codes Settings would reject are dropped."""
+        csv_file = tmp_path / "stations.csv"
+        csv_file.write_text(
+            "lhg_code,lhg_url\n"
+            "lhg_fluss,-5.htm\n"
+            "lhg_fluss,+12.htm\n"
+            "lhg_fluss,0012.htm\n"
+            "lhg_fluss,12345.htm\n"
+            "lhg_fluss,2099.htm\n",
+            encoding="utf-8",
+        )
+
+        assert get_river_station_codes(csv_file) == ["2099"]
@@ -1,10 +1,10 @@
 """Unit tests for SparqlClient."""
 
-import time
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
+import orjson
 import pytest
-from SPARQLWrapper.SPARQLExceptions import SPARQLWrapperException
+import requests
 
 from lindas_hydro_scraper.core.sparql_client import SparqlClient
 
@@ -13,19 +13,23 @@ class TestSparqlClient:
     """Test cases for SparqlClient."""
 
     @pytest.fixture
-    def client(self):
-        """Create a SparqlClient instance."""
-        return SparqlClient(
-            endpoint_url="http://example.com/sparql",
-            max_retries=3,
-            initial_delay=0.1,
-        )
+    def mock_session(self):
+        """Create a mock requests.Session."""
+        with patch("lindas_hydro_scraper.core.sparql_client.requests.Session") as mock:
+            yield mock
 
     @pytest.fixture
-    def mock_sparql_wrapper(self):
-        """Create a mock SPARQLWrapper."""
-        with patch("lindas_hydro_scraper.core.sparql_client.SPARQLWrapper") as mock:
-            yield mock
+    def session(self, mock_session):
+        """Provide the mock session instance used by new clients."""
+        return mock_session.return_value
+
+    @pytest.fixture
+    def client(self, request, mock_session):
+        """Create a SparqlClient on the mock session.
+
+        Indirect parametrization passes extra constructor arguments.
+        """
+        return SparqlClient("http://example.com/sparql", **getattr(request, "param", {}))
 
     @pytest.fixture
     def valid_query_results(self):
@@ -39,7 +43,7 @@ class TestSparqlClient:
             }
         }
 
-    def test_init(self, mock_sparql_wrapper):
+    def test_init(self, mock_session):
         """Test client initialization."""
         endpoint_url = "http://example.com/sparql"
         client = SparqlClient(endpoint_url)
@@ -48,45 +52,43 @@ class TestSparqlClient:
         assert client.max_retries == 3  # Default from constants
         assert client.initial_delay == 2  # Default from constants
 
-        mock_sparql_wrapper.assert_called_once_with(endpoint_url)
-        mock_instance = mock_sparql_wrapper.return_value
-        mock_instance.setReturnFormat.assert_called_once()
-        mock_instance.setMethod.assert_called_once_with("POST")
+        mock_session.assert_called_once_with()
+        session = mock_session.return_value
+        session.headers.update.assert_called_once_with(
+            {"Accept": "application/sparql-results+json"}
+        )
+        mounted = [call.args[0] for call in session.mount.call_args_list]
+        assert mounted == ["http://", "https://"]
 
-    def test_execute_query_success(self, client, mock_sparql_wrapper, valid_query_results):
-        """Test successful query execution."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
+    def test_close(self, client, session):
+        """Test closing the client closes the underlying session."""
+        client.close()
 
-        # Create new client to use mocked SPARQLWrapper
-        client = SparqlClient("http://example.com/sparql")
+        session.close.assert_called_once()
 
+    def test_execute_query_success(self, client, session, valid_query_results):
+        """Test successful query execution."""
         # Setup mock query result
-        mock_query = Mock()
-        mock_query.convert.return_value = valid_query_results
-        mock_instance.query.return_value = mock_query
+        mock_response = Mock()
+        mock_response.content = orjson.dumps(valid_query_results)
+        session.post.return_value = mock_response
 
         query = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 10"
         result = client.execute_query(query)
 
         assert result == valid_query_results
-        mock_instance.setQuery.assert_called_once_with(query)
-        mock_instance.query.assert_called_once()
-        mock_query.convert.assert_called_once()
+        session.post.assert_called_once_with(
+            "http://example.com/sparql", data={"query": query}, timeout=30
+        )
+        mock_response.raise_for_status.assert_called_once()
 
-    def test_execute_query_empty_results(self, client, mock_sparql_wrapper):
+    def test_execute_query_empty_results(self, client, session):
         """Test query execution with empty results returns the results dict."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client to use mocked SPARQLWrapper
-        client = SparqlClient("http://example.com/sparql")
-
         # Setup mock query result with empty bindings
         empty_results = {"results": {"bindings": []}}
-        mock_query = Mock()
-        mock_query.convert.return_value = empty_results
-        mock_instance.query.return_value = mock_query
+        mock_response = Mock()
+        mock_response.content = orjson.dumps(empty_results)
+        session.post.return_value = mock_response
 
         query = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 10"
         result = client.execute_query(query)
@@ -94,65 +96,66 @@ class TestSparqlClient:
         # Empty results are still valid results - they return the dict, not None
         assert result == empty_results
 
-    def test_execute_query_retry_on_failure(self, client, mock_sparql_wrapper, valid_query_results):
+    @pytest.mark.parametrize("client", [{"initial_delay": 0.01}], indirect=True)
+    def test_execute_query_retry_on_failure(self, client, session, valid_query_results):
         """Test retry logic on query failure."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client with shorter retry delay for faster tests
-        client = SparqlClient("http://example.com/sparql", initial_delay=0.01)
-
         # Setup mock to fail twice then succeed
-        mock_query = Mock()
-        mock_query.convert.side_effect = [
-            SPARQLWrapperException("Connection error"),
-            SPARQLWrapperException("Timeout"),
-            valid_query_results,
+        mock_response = Mock()
+        mock_response.content = orjson.dumps(valid_query_results)
+        session.post.side_effect = [
+            requests.ConnectionError("Connection error"),
+            requests.Timeout("Timeout"),
+            mock_response,
         ]
-        mock_instance.query.return_value = mock_query
 
         with patch("time.sleep") as mock_sleep:
             result = client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
         assert result == valid_query_results
-        assert mock_instance.query.call_count == 3
+        assert session.post.call_count == 3
         assert mock_sleep.call_count == 2
-        # Check exponential backoff
-        mock_sleep.assert_any_call(0.01)
-        mock_sleep.assert_any_call(0.02)
+        # Check jittered exponential backoff stays within 0.01 * 2**n
+        for n, call in enumerate(mock_sleep.call_args_list):
+            assert 0 <= call.args[0] <= 0.01 * 2**n
+
+    @pytest.mark.parametrize("client", [{"initial_delay": 0.01}], indirect=True)
+    def test_execute_query_retry_on_invalid_json(self, client, session, valid_query_results):
+        """Test that a malformed response body is retried."""
+        bad_response = Mock()
+        bad_response.content = b"<html>Bad Gateway</html>"
+        good_response = Mock()
+        good_response.content = orjson.dumps(valid_query_results)
+        session.post.side_effect = [bad_response, good_response]
 
-    def test_execute_query_max_retries_exceeded(self, client, mock_sparql_wrapper):
-        """Test query fails after max retries."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
+        with patch("time.sleep"):
+            result = client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
-        # Create new client with shorter retry delay
-        client = SparqlClient("http://example.com/sparql", max_retries=2, initial_delay=0.01)
+        assert result == valid_query_results
+        assert session.post.call_count == 2
 
+    @pytest.mark.parametrize(
+        "client", [{"max_retries": 2, "initial_delay": 0.01}], indirect=True
+    )
+    def test_execute_query_max_retries_exceeded(self, client, session):
+        """Test query fails after max retries."""
         # Setup mock to always fail
-        mock_instance.query.side_effect = SPARQLWrapperException("Connection error")
+        session.post.side_effect = requests.ConnectionError("Connection error")
 
         with patch("time.sleep"):
             result = client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
         assert result is None
-        assert mock_instance.query.call_count == 2
+        assert session.post.call_count == 2
 
-    def test_execute_query_unexpected_exception(self, client, mock_sparql_wrapper):
+    def test_execute_query_unexpected_exception(self, client, session):
         """Test handling of unexpected exceptions."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client
-        client = SparqlClient("http://example.com/sparql")
-
         # Setup mock to raise unexpected exception
-        mock_instance.query.side_effect = ValueError("Unexpected error")
+        session.post.side_effect = ValueError("Unexpected error")
 
         result = client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
         assert result is None
-        assert mock_instance.query.call_count == 1
+        assert session.post.call_count == 1
 
     def test_validate_results_valid(self, client, valid_query_results):
         """Test validation of valid results."""
@@ -174,128 +177,171 @@ class TestSparqlClient:
         # Bindings not a list
         assert client._validate_results({"results": {"bindings": "not_a_list"}}) is False
 
-    def test_test_connection_success(self, client, mock_sparql_wrapper):
+    def test_test_connection_success(self, client, session):
         """Test successful connection test."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client
-        client = SparqlClient("http://example.com/sparql")
-
         # Setup mock for successful test query
-        mock_query = Mock()
-        mock_query.convert.return_value = {
-            "results": {"bindings": [{"s": {"value": "http://example.com/test"}}]}
-        }
-        mock_instance.query.return_value = mock_query
+        mock_response = Mock()
+        mock_response.content = orjson.dumps(
+            {"results": {"bindings": [{"s": {"value": "http://example.com/test"}}]}}
+        )
+        session.post.return_value = mock_response
 
         assert client.test_connection() is True
 
         # Verify test query was executed
         expected_query = "SELECT ?s WHERE { ?s ?p ?o } LIMIT 1"
-        mock_instance.setQuery.assert_called_with(expected_query)
+        assert session.post.call_args.kwargs["data"] == {"query": expected_query}
 
-    def test_test_connection_failure(self, client, mock_sparql_wrapper):
+    @pytest.mark.parametrize("client", [{"initial_delay": 0.01}], indirect=True)
+    def test_test_connection_failure(self, client, session):
         """Test failed connection test."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client
-        client = SparqlClient("http://example.com/sparql")
-
         # Setup mock to fail
-        mock_instance.query.side_effect = SPARQLWrapperException("Connection refused")
+        session.post.side_effect = requests.ConnectionError("Connection refused")
 
-        assert client.test_connection() is False
+        with patch("time.sleep"):
+            assert client.test_connection() is False
 
     @patch("lindas_hydro_scraper.core.sparql_client.logger")
-    def test_execute_query_logging(self, mock_logger, client, mock_sparql_wrapper, valid_query_results):
+    def test_execute_query_logging(self, mock_logger, client, session, valid_query_results):
         """Test logging during query execution."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client
-        client = SparqlClient("http://example.com/sparql")
-
         # Setup successful query
-        mock_query = Mock()
-        mock_query.convert.return_value = valid_query_results
-        mock_instance.query.return_value = mock_query
+        mock_response = Mock()
+        mock_response.content = orjson.dumps(valid_query_results)
+        session.post.return_value = mock_response
 
         client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
         # Check debug log for execution
         mock_logger.debug.assert_called()
-        debug_call = mock_logger.debug.call_args[0][0]
+        debug_args = mock_logger.debug.call_args[0]
+        debug_call = debug_args[0] % debug_args[1:]
         assert "Executing query" in debug_call
 
         # Check info log for success
         mock_logger.info.assert_called()
-        info_call = mock_logger.info.call_args[0][0]
+        info_args = mock_logger.info.call_args[0]
+        info_call = info_args[0] % info_args[1:]
         assert "Query successful" in info_call
         assert "2 bindings" in info_call
 
     @patch("lindas_hydro_scraper.core.sparql_client.logger")
-    def test_execute_query_logging_on_failure(self, mock_logger, client, mock_sparql_wrapper):
+    @pytest.mark.parametrize("client", [{"max_retries": 1}], indirect=True)
+    def test_execute_query_logging_on_failure(self, mock_logger, client, session):
         """Test logging during query failure."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client with only 1 retry
-        client = SparqlClient("http://example.com/sparql", max_retries=1)
-
         # Setup query to fail
-        mock_instance.query.side_effect = SPARQLWrapperException("Connection error")
+        session.post.side_effect = requests.ConnectionError("Connection error")
 
         client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
         # Check warning log
         mock_logger.warning.assert_called()
-        warning_call = mock_logger.warning.call_args[0][0]
+        warning_args = mock_logger.warning.call_args[0]
+        warning_call = warning_args[0] % warning_args[1:]
         assert "SPARQL query failed" in warning_call
 
         # Check error log for final failure
         mock_logger.error.assert_called()
-        error_call = mock_logger.error.call_args[0][0]
+        error_args = mock_logger.error.call_args[0]
+        error_call = error_args[0] % error_args[1:]
         assert "Query failed after" in error_call
 
     @patch("lindas_hydro_scraper.core.sparql_client.logger")
-    def test_execute_query_logging_empty_results(self, mock_logger, client, mock_sparql_wrapper):
+    def test_execute_query_logging_empty_results(self, mock_logger, client, session):
         """Test logging when query returns empty results - logs info about 0 bindings."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create new client
-        client = SparqlClient("http://example.com/sparql")
-
         # Setup query with empty results
-        mock_query = Mock()
-        mock_query.convert.return_value = {"results": {"bindings": []}}
-        mock_instance.query.return_value = mock_query
+        mock_response = Mock()
+        mock_response.content = orjson.dumps({"results": {"bindings": []}})
+        session.post.return_value = mock_response
 
         client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
         # Check info log for successful query with 0 bindings
         mock_logger.info.assert_called()
-        info_call = mock_logger.info.call_args[0][0]
+        info_args = mock_logger.info.call_args[0]
+        info_call = info_args[0] % info_args[1:]
         assert "Query successful" in info_call
         assert "0 bindings" in info_call
 
-    def test_exponential_backoff(self, client, mock_sparql_wrapper):
+    @pytest.mark.parametrize(
+        "client", [{"max_retries": 4, "initial_delay": 1.0}], indirect=True
+    )
+    def test_exponential_backoff(self, client, session):
         """Test exponential backoff behavior."""
-        mock_instance = Mock()
-        mock_sparql_wrapper.return_value = mock_instance
-
-        # Create client with specific retry settings
-        client = SparqlClient("http://example.com/sparql", max_retries=4, initial_delay=1.0)
-
         # Setup to fail all attempts
-        mock_instance.query.side_effect = SPARQLWrapperException("Error")
+        session.post.side_effect = requests.ConnectionError("Error")
 
         sleep_calls = []
         with patch("time.sleep", side_effect=lambda x: sleep_calls.append(x)):
             client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
 
-        # Verify exponential backoff: 1, 2, 4 seconds
+        # Verify jittered exponential backoff: up to 1, 2, 4 seconds
         assert len(sleep_calls) == 3
-        assert sleep_calls == [1.0, 2.0, 4.0]
\ No newline at end of file
+        for n, delay in enumerate(sleep_calls):
+            assert 0 <= delay <= 1.0 * 2**n
+
+    @pytest.mark.parametrize(
+        "client", [{"max_retries": 4, "initial_delay": 60.0}], indirect=True
+    )
+    def test_backoff_is_capped(self, client, session):
+        """Test that backoff never exceeds the maximum retry delay."""
+        session.post.side_effect = requests.ConnectionError("Error")
+
+        with patch("time.sleep") as mock_sleep:
+            client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
+
+        assert all(call.args[0] <= 60 for call in mock_sleep.call_args_list)
+
+    @pytest.mark.parametrize(
+        "client",
+        [{"max_retries": 5, "initial_delay": 1.0, "retry_budget": 0}],
+        indirect=True,
+    )
+    def test_retry_budget_stops_retries(self, client, session):
+        """Test that no retry starts once the time budget is spent."""
+        session.post.side_effect = requests.ConnectionError("Error")
+
+        with patch("time.sleep") as mock_sleep:
+            result = client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
+
+        assert result is None
+        assert session.post.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("lindas_hydro_scraper.core.sparql_client.logger")
+    @pytest.mark.parametrize(
+        "client",
+        [{"max_retries": 5, "initial_delay": 1.0, "retry_budget": 0}],
+        indirect=True,
+    )
+    def test_failure_log_reports_attempts_made(self, mock_logger, client, session):
+        """Test that the final error counts attempts made, not the retry limit."""
+        session.post.side_effect = requests.ConnectionError("Error")
+
+        client.execute_query("SELECT ?s WHERE { ?s ?p ?o }")
+
+        error_args = mock_logger.error.call_args[0]
+        assert error_args[0] % error_args[1:] == (
+            "Query failed after 1 attempts. Last error: Error"
+        )
+
+    @pytest.mark.parametrize("client", [{"pool_size": 2}], indirect=True)
+    def test_execute_queries_preserves_order(self, client, session, valid_query_results):
+        """Test that concurrent queries return results in input order."""
+        empty_response = Mock()
+        empty_response.content = orjson.dumps({"results": {"bindings": []}})
+        valid_response = Mock()
+        valid_response.content = orjson.dumps(valid_query_results)
+
+        def post(url, data, timeout):
+            return valid_response if data["query"] == "valid" else empty_response
+
+        session.post.side_effect = post
+
+        results = client.execute_queries(["valid", "empty", "valid"])
+
+        assert results == [
+            valid_query_results,
+            {"results": {"bindings": []}},
+            valid_query_results,
+        ]
+        assert session.post.call_count == 3